@@ -1,37 +1,47 @@
-"""Speedtest client library -- networking, measurement, and statistics."""
-
-from .api import ClientInfo, Server, SpeedtestAPI
-from .download import DownloadResult, DownloadTester
-from .latency import LatencyTester, PingResult, ServerLatencyResult
-from .stats import (
-    ConnectionStats,
-    LatencyStats,
-    SpeedStats,
-    calculate_iqm,
-    calculate_jitter,
-    calculate_percentile,
-    format_latency,
-    format_speed,
-)
-from .upload import UploadResult, UploadTester
-
-__all__ = [
-    "ClientInfo",
-    "ConnectionStats",
-    "DownloadResult",
-    "DownloadTester",
-    "LatencyStats",
-    "LatencyTester",
-    "PingResult",
-    "Server",
-    "ServerLatencyResult",
-    "SpeedStats",
-    "SpeedtestAPI",
-    "UploadResult",
-    "UploadTester",
-    "calculate_iqm",
-    "calculate_jitter",
-    "calculate_percentile",
-    "format_latency",
-    "format_speed",
-]
+"""
+Speedtest client library -- networking, measurement, and statistics.
+
+Names are resolved lazily (PEP 562) so that importing a light submodule such
+as ``client.constants`` doesn't also import aiohttp and websockets.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "ClientInfo": ".api",
+    "Server": ".api",
+    "SpeedtestAPI": ".api",
+    "DownloadResult": ".download",
+    "DownloadTester": ".download",
+    "LatencyTester": ".latency",
+    "PingResult": ".latency",
+    "ServerLatencyResult": ".latency",
+    "ConnectionStats": ".stats",
+    "LatencyStats": ".stats",
+    "SpeedStats": ".stats",
+    "calculate_iqm": ".stats",
+    "calculate_jitter": ".stats",
+    "calculate_percentile": ".stats",
+    "calculate_stats_bundle": ".stats",
+    "format_latency": ".stats",
+    "format_speed": ".stats",
+    "quick_stats": ".stats",
+    "UploadResult": ".upload",
+    "UploadTester": ".upload",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):  # noqa: ANN202
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():  # noqa: ANN202
+    return sorted(set(globals()) | set(__all__))
@@ -7,13 +7,16 @@ protocol (``async with SpeedtestAPI() as api: ...``).
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import re
+import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 import aiohttp
 
-from .constants import BASE_URL, COMMON_HEADERS, SERVERS_URL
+from .constants import API_CACHE_TTL, BASE_URL, COMMON_HEADERS, SERVERS_URL
 
 
 # ---------------------------------------------------------------------------
@@ -109,6 +112,37 @@ class ClientInfo:
         }
 
 
+# ---------------------------------------------------------------------------
+# Caching
+# ---------------------------------------------------------------------------
+
+def _async_ttl_cache(ttl: float):  # noqa: ANN202
+    """
+    Cache an async method's result for *ttl* seconds, keyed on its arguments.
+
+    The cache is shared by all instances (``self`` is not part of the key),
+    so repeat-mode runs -- each with a fresh ``SpeedtestAPI`` -- reuse
+    recent answers instead of hitting speedtest.net again.
+    """
+    def decorator(func):  # noqa: ANN001, ANN202
+        cache: Dict[tuple, tuple] = {}
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):  # noqa: ANN001, ANN202
+            key = (args, tuple(sorted(kwargs.items())))
+            hit = cache.get(key)
+            if hit is not None and hit[0] > time.monotonic():
+                return hit[1]
+            value = await func(self, *args, **kwargs)
+            cache[key] = (time.monotonic() + ttl, value)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
 # ---------------------------------------------------------------------------
 # API client
 # ---------------------------------------------------------------------------
@@ -116,7 +150,8 @@ class ClientInfo:
 class SpeedtestAPI:
     """Async context-manager wrapping the Speedtest.net REST API."""
 
-    def __init__(self) -> None:
+    def __init__(self, max_connections: Optional[int] = None) -> None:
+        self._max_connections = max_connections
         self._session: Optional[aiohttp.ClientSession] = None
         self.servers: List[Server] = []
         self.client_info: Optional[ClientInfo] = None
@@ -124,7 +159,16 @@ class SpeedtestAPI:
     # -- Context manager ----------------------------------------------------
 
     async def __aenter__(self) -> SpeedtestAPI:
-        self._session = aiohttp.ClientSession(headers=COMMON_HEADERS)
+        connector = None
+        if self._max_connections:
+            # aiohttp defaults to 100 sockets in total and no per-host limit.
+            # This is a tighter bound, not a speed-up: the pool stays sized to
+            # the streams this run can actually open.
+            connector = aiohttp.TCPConnector(
+                limit=self._max_connections,
+                limit_per_host=self._max_connections,
+            )
+        self._session = aiohttp.ClientSession(headers=COMMON_HEADERS, connector=connector)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # noqa: ANN001
@@ -132,6 +176,11 @@ class SpeedtestAPI:
             await self._session.close()
             self._session = None
 
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The underlying session, for sharing its pool with other testers."""
+        return self._ensure_session()
+
     # -- Internal helpers ---------------------------------------------------
 
     def _ensure_session(self) -> aiohttp.ClientSession:
@@ -146,6 +195,37 @@ class SpeedtestAPI:
 
     async def get_client_info(self) -> ClientInfo:
         """Scrape client IP / ISP / location from the speedtest.net home page."""
+        self.client_info = await self._fetch_client_info()
+        return self.client_info
+
+    async def fetch_servers(self, limit: int = 10) -> List[Server]:
+        """Return up to *limit* nearby servers, sorted by distance."""
+        self.servers = list(await self._fetch_servers(limit))
+        return self.servers
+
+    async def warm_up(self, server: Server) -> None:
+        """
+        Resolve and connect to *server* ahead of the transfer tests.
+
+        A tiny download leaves the DNS answer and a keep-alive TLS connection
+        in this session's pool, so the first download worker skips both.
+        Failures are ignored; the download test reports real problems.
+        """
+        session = self._ensure_session()
+        try:
+            async with session.get(
+                f"{server.download_url}?size=1",
+                headers={"Accept-Encoding": "identity"},
+                timeout=aiohttp.ClientTimeout(total=5),
+            ) as resp:
+                await resp.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+            pass
+
+    # -- Cached fetches (shared across instances) ---------------------------
+
+    @_async_ttl_cache(API_CACHE_TTL)
+    async def _fetch_client_info(self) -> ClientInfo:
         session = self._ensure_session()
 
         async with session.get(BASE_URL) as resp:
@@ -156,28 +236,41 @@ class SpeedtestAPI:
             m = re.search(pattern, html)
             return m.group(1) if m else ""
 
-        self.client_info = ClientInfo(
+        return ClientInfo(
             ip=_extract(r'"ipAddress"\s*:\s*"([^"]+)"'),
             isp=_extract(r'"ispName"\s*:\s*"([^"]+)"'),
             lat=float(_extract(r'"latitude"\s*:\s*([\d.]+)') or 0),
             lon=float(_extract(r'"longitude"\s*:\s*([\d.]+)') or 0),
             country=_extract(r'"countryCode"\s*:\s*"([^"]+)"'),
         )
-        return self.client_info
 
-    async def fetch_servers(self, limit: int = 10) -> List[Server]:
-        """Return up to *limit* nearby servers, sorted by distance."""
-        session = self._ensure_session()
-
-        params = {
-            "engine": "js",
-            "https_functional": "true",
-            "limit": str(limit),
-        }
+    @_async_ttl_cache(API_CACHE_TTL)
+    async def _fetch_servers(self, limit: int) -> List[Server]:
+        return await _get_servers(self._ensure_session(), limit)
 
-        async with session.get(SERVERS_URL, params=params) as resp:
-            resp.raise_for_status()
-            data = await resp.json()
-
-        self.servers = [Server.from_dict(s) for s in data]
-        return self.servers
+    @classmethod
+    async def fetch_servers_oneshot(cls, limit: int = 10) -> List[Server]:
+        """
+        Fetch the server list with a throwaway single-connection session.
+
+        For callers that need nothing else from the API (``--list-servers``),
+        this skips the pooled keep-alive session of the context manager.
+        """
+        connector = aiohttp.TCPConnector(limit=1, force_close=True)
+        async with aiohttp.ClientSession(headers=COMMON_HEADERS, connector=connector) as session:
+            return await _get_servers(session, limit)
+
+
+async def _get_servers(session: aiohttp.ClientSession, limit: int) -> List[Server]:
+    """GET the nearby-servers endpoint and parse the response."""
+    params = {
+        "engine": "js",
+        "https_functional": "true",
+        "limit": str(limit),
+    }
+
+    async with session.get(SERVERS_URL, params=params) as resp:
+        resp.raise_for_status()
+        data = await resp.json()
+
+    return [Server.from_dict(s) for s in data]
@@ -30,6 +30,8 @@ COMMON_HEADERS = {
 BASE_URL = "https://www.speedtest.net"
 SERVERS_URL = "https://www.speedtest.net/api/js/servers"
 
+API_CACHE_TTL = 60.0             # seconds to reuse client info / server list
+
 # ---------------------------------------------------------------------------
 # Connection limits
 # ---------------------------------------------------------------------------
@@ -37,6 +39,7 @@ SERVERS_URL = "https://www.speedtest.net/api/js/servers"
 MIN_CONNECTIONS = 1
 MAX_CONNECTIONS = 32
 DEFAULT_CONNECTIONS = 4
+AUTO_CONNECTION_RTT_MS = 10.0    # auto mode: one stream per 10 ms of latency
 
 # ---------------------------------------------------------------------------
 # Timing
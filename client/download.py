@@ -8,9 +8,12 @@ and EMA-smoothed progress callback.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import time
+from array import array
 from dataclasses import dataclass, field
-from typing import Callable, List, Optional
+from functools import partial
+from typing import AsyncIterator, Callable, List, Optional, Sequence
 
 import aiohttp
 
@@ -28,6 +31,10 @@ from .constants import (
 )
 from .stats import ConnectionStats, LatencyStats, calculate_iqm
 
+# Per-request settings, so they also apply on a session shared with the API
+_HEADERS = {"Accept-Encoding": "identity"}
+_TIMEOUT = aiohttp.ClientTimeout(total=None, connect=5, sock_read=5)
+
 
 # ---------------------------------------------------------------------------
 # Result
@@ -43,7 +50,7 @@ class DownloadResult:
     duration_ms: float = 0.0
     connections: List[ConnectionStats] = field(default_factory=list)
     loaded_latency: Optional[LatencyStats] = None
-    samples: List[float] = field(default_factory=list)
+    samples: Sequence[float] = field(default_factory=partial(array, "d"))
 
     def calculate(self) -> None:
         """Derive speed from total bytes and wall-clock duration."""
@@ -88,10 +95,18 @@ class DownloadTester:
     chunks in a loop.  A sampler coroutine records throughput every
     ``SAMPLE_INTERVAL`` seconds, discarding the first ``WARMUP_SECONDS``.
     The final speed is the IQM of the post-warmup samples.
+
+    Pass an existing *session* (e.g. ``SpeedtestAPI.session``) to reuse its
+    connection pool; otherwise a dedicated session is opened per test.
     """
 
-    def __init__(self, duration_seconds: float = 10.0) -> None:
+    def __init__(
+        self,
+        duration_seconds: float = 10.0,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
         self.duration_seconds = duration_seconds
+        self.session = session
         self.on_progress: Optional[Callable[[float, float], None]] = None
 
     async def test(self, server: Server, connections: int = 4) -> DownloadResult:
@@ -99,7 +114,7 @@ class DownloadTester:
 
         result = DownloadResult()
         total_bytes = 0
-        speed_samples: List[float] = []
+        speed_samples = array("d")  # unboxed doubles, appended per sample
         conn_stats: List[ConnectionStats] = []
 
         start_time = time.perf_counter()
@@ -118,7 +133,7 @@ class DownloadTester:
             while not stop.is_set() and time.perf_counter() < end_time:
                 try:
                     url = f"{server.download_url}?size={DOWNLOAD_FILE_SIZE}"
-                    async with session.get(url) as resp:
+                    async with session.get(url, headers=_HEADERS, timeout=_TIMEOUT) as resp:
                         while not stop.is_set():
                             if time.perf_counter() >= end_time:
                                 break
@@ -188,21 +203,7 @@ class DownloadTester:
 
         # -- Orchestration --------------------------------------------------
 
-        connector = aiohttp.TCPConnector(
-            ssl=True,
-            limit=connections,
-            limit_per_host=connections,
-            force_close=False,
-            enable_cleanup_closed=True,
-        )
-        timeout = aiohttp.ClientTimeout(total=None, connect=5, sock_read=5)
-        headers = {**COMMON_HEADERS, "Accept-Encoding": "identity"}
-
-        async with aiohttp.ClientSession(
-            headers=headers,
-            connector=connector,
-            timeout=timeout,
-        ) as session:
+        async with self._open_session(connections) as session:
             workers = [asyncio.create_task(_worker(session, i)) for i in range(connections)]
             sampler = asyncio.create_task(_sampler())
 
@@ -245,3 +246,24 @@ class DownloadTester:
         result.calculate_from_samples()
 
         return result
+
+    @contextlib.asynccontextmanager
+    async def _open_session(self, connections: int) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the shared session, or a dedicated one sized to *connections*."""
+        if self.session is not None:
+            yield self.session
+            return
+
+        connector = aiohttp.TCPConnector(
+            ssl=True,
+            limit=connections,
+            limit_per_host=connections,
+            force_close=False,
+            enable_cleanup_closed=True,
+        )
+        async with aiohttp.ClientSession(
+            headers=COMMON_HEADERS,
+            connector=connector,
+            timeout=_TIMEOUT,
+        ) as session:
+            yield session
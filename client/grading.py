@@ -58,27 +58,32 @@ def compare_with_previous(
     if not history:
         return None
 
-    prev = history[-1]
+    ping, dl, ul = _extract(current)
+    prev_ping, prev_dl, prev_ul = _extract(history[-1])
+    return {
+        "ping_delta": ping - prev_ping,
+        "download_delta": dl - prev_dl,
+        "upload_delta": ul - prev_ul,
+        "prev_ping": prev_ping,
+        "prev_download": prev_dl,
+        "prev_upload": prev_ul,
+    }
 
-    def _get_dl(entry: dict) -> float:
-        dl = entry.get("download", {})
-        return dl.get("speed_mbps", 0) if isinstance(dl, dict) else 0
 
-    def _get_ul(entry: dict) -> float:
-        ul = entry.get("upload", {})
-        return ul.get("speed_mbps", 0) if isinstance(ul, dict) else 0
+def _extract(entry: Dict[str, Any]) -> Tuple[float, float, float]:
+    """(ping, download Mbps, upload Mbps) from a result or history entry."""
+    dl = entry.get("download")
+    ul = entry.get("upload")
+    return (
+        entry.get("ping", 0),
+        dl.get("speed_mbps", 0) if isinstance(dl, dict) else 0,
+        ul.get("speed_mbps", 0) if isinstance(ul, dict) else 0,
+    )
 
-    def _get_ping(entry: dict) -> float:
-        return entry.get("ping", 0)
 
-    return {
-        "ping_delta": _get_ping(current) - _get_ping(prev),
-        "download_delta": _get_dl(current) - _get_dl(prev),
-        "upload_delta": _get_ul(current) - _get_ul(prev),
-        "prev_ping": _get_ping(prev),
-        "prev_download": _get_dl(prev),
-        "prev_upload": _get_ul(prev),
-    }
+# Indexed by 2 * (value < 0) + invert: a rise is good unless *invert*.
+_DELTA_COLORS = ("green", "red", "red", "green")
+_DELTA_SIGNS = ("+", "+", "-", "-")
 
 
 def format_delta(value: float, unit: str, invert: bool = False) -> str:
@@ -88,14 +93,11 @@ def format_delta(value: float, unit: str, invert: bool = False) -> str:
     *invert*: True for metrics where lower is better (ping).
     """
     if abs(value) < 0.01:
-        return f"[dim](same)[/dim]"
-
-    sign = "+" if value > 0 else ""
-    # For ping, negative is good; for speed, positive is good
-    is_good = (value < 0) if invert else (value > 0)
-    color = "green" if is_good else "red"
+        return "[dim](same)[/dim]"
 
-    return f"[{color}]{sign}{value:.1f} {unit}[/{color}]"
+    idx = (value < 0) * 2 + bool(invert)
+    color = _DELTA_COLORS[idx]
+    return f"[{color}]{_DELTA_SIGNS[idx]}{abs(value):.1f} {unit}[/{color}]"
 
 
 # ---------------------------------------------------------------------------
@@ -8,11 +8,17 @@ can be appended to safely (no need to parse the whole file to add a record).
 from __future__ import annotations
 
 import json
+import math
 import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # optional speed-up (the "fast" extra)
+    orjson = None
+
 
 # ---------------------------------------------------------------------------
 # Defaults
@@ -27,6 +33,15 @@ def _history_path() -> str:
     return os.path.join(_DEFAULT_DIR, _DEFAULT_FILE)
 
 
+def _dumps_line(entry: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
 # ---------------------------------------------------------------------------
 # Write
 # ---------------------------------------------------------------------------
@@ -41,8 +56,8 @@ def save_result(result: Dict[str, Any]) -> str:
     if "timestamp" not in entry:
         entry["timestamp"] = datetime.now(timezone.utc).isoformat()
 
-    with open(path, "a", encoding="utf-8") as fh:
-        fh.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    with open(path, "ab") as fh:
+        fh.write(_dumps_line(entry))
 
     return path
 
@@ -57,18 +72,25 @@ def load_history(limit: int = _MAX_DISPLAY) -> List[Dict[str, Any]]:
     if not os.path.isfile(path):
         return []
 
-    entries: List[Dict[str, Any]] = []
     with open(path, encoding="utf-8") as fh:
-        for line in fh:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue  # skip corrupt lines
+        lines = fh.readlines()
 
-    return entries[-limit:]
+    # Decode newest-first and stop at *limit*: older lines are never parsed,
+    # so a long history costs a file read, not a JSON decode per entry.
+    entries: List[Dict[str, Any]] = []
+    for line in reversed(lines):
+        if len(entries) >= limit:
+            break
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entries.append(_loads(line))
+        except json.JSONDecodeError:  # orjson's error subclasses this
+            continue  # skip corrupt lines
+
+    entries.reverse()
+    return entries
 
 
 # ---------------------------------------------------------------------------
@@ -164,16 +186,14 @@ def group_by_hour(entries: List[Dict[str, Any]]) -> Dict[int, Dict[str, List[flo
 
 def format_hourly_summary(buckets: Dict[int, Dict[str, List[float]]]) -> List[Dict[str, Any]]:
     """Format hourly buckets into rows with averages."""
-    import statistics
-
     rows = []
     for hour in sorted(buckets.keys()):
         data = buckets[hour]
         rows.append({
             "hour": f"{hour:02d}:00",
             "tests": max(len(data["download"]), len(data["upload"]), len(data["ping"])),
-            "avg_download": statistics.mean(data["download"]) if data["download"] else 0,
-            "avg_upload": statistics.mean(data["upload"]) if data["upload"] else 0,
-            "avg_ping": statistics.mean(data["ping"]) if data["ping"] else 0,
+            "avg_download": math.fsum(data["download"]) / len(data["download"]) if data["download"] else 0,
+            "avg_upload": math.fsum(data["upload"]) / len(data["upload"]) if data["upload"] else 0,
+            "avg_ping": math.fsum(data["ping"]) / len(data["ping"]) if data["ping"] else 0,
         })
     return rows
@@ -15,8 +15,10 @@ from __future__ import annotations
 
 import asyncio
 import time
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import partial
+from typing import List, Optional, Sequence
 
 import websockets
 import websockets.exceptions
@@ -34,6 +36,8 @@ _WS_CONNECT_TIMEOUT = 5.0   # seconds to establish the WS connection
 _HANDSHAKE_TIMEOUT = 2.0     # max wait for HELLO/YOURIP/CAPABILITIES
 _MSG_TIMEOUT = 0.5           # per-message timeout during handshake
 _PING_TIMEOUT = 5.0          # per-ping round-trip timeout
+_WARMUP_PINGS = 1            # leading round-trips measured but discarded
+_DEFAULT_CONCURRENT = 8      # servers probed in parallel by default
 _MAX_CONCURRENT = 10         # semaphore cap for parallel server tests
 
 
@@ -58,7 +62,7 @@ class ServerLatencyResult:
 
     server: Server
     external_ip: str = ""
-    pings: List[float] = field(default_factory=list)
+    pings: Sequence[float] = field(default_factory=partial(array, "d"))
     latency_ms: float = 0.0     # best (min) latency
     jitter_ms: float = 0.0
     packet_loss: float = 0.0    # percentage 0-100
@@ -102,9 +106,11 @@ class LatencyTester:
         self,
         ping_count: int = DEFAULT_PING_COUNT,
         timeout: float = _PING_TIMEOUT,
+        warmup_pings: int = _WARMUP_PINGS,
     ) -> None:
         self.ping_count = ping_count
         self.timeout = timeout
+        self.warmup_pings = warmup_pings
 
     # -- Single server ------------------------------------------------------
 
@@ -122,6 +128,17 @@ class LatencyTester:
             ) as ws:
                 await self._read_handshake(ws, result)
 
+                # The first round-trip on a fresh connection still carries
+                # connection-setup cost; don't let it skew min / jitter.
+                # If a warm-up PONG never arrives, a late one would be read as
+                # the first measured sample, so the server is dropped instead.
+                for _ in range(self.warmup_pings):
+                    warm = await self._ping_once(ws)
+                    if not warm.success:
+                        result.success = False
+                        result.error = f"Warm-up ping failed: {warm.error}"
+                        return result
+
                 for _ in range(self.ping_count):
                     attempts += 1
                     pr = await self._ping_once(ws)
@@ -153,9 +170,14 @@ class LatencyTester:
     async def test_servers(
         self,
         servers: List[Server],
-        concurrent: int = 1,
+        concurrent: int = _DEFAULT_CONCURRENT,
     ) -> List[ServerLatencyResult]:
-        """Test *servers* and return results sorted by latency (best first)."""
+        """
+        Test *servers* and return results sorted by latency (best first).
+
+        Up to *concurrent* servers are probed at once; pings to any single
+        server stay sequential so its jitter is still meaningful.
+        """
         concurrent = max(1, min(concurrent, _MAX_CONCURRENT))
 
         if concurrent == 1:
@@ -167,7 +189,17 @@ class LatencyTester:
                 async with sem:
                     return await self.test_server(srv)
 
-            results = await asyncio.gather(*[_guarded(s) for s in servers])
+            tasks = [asyncio.create_task(_guarded(s)) for s in servers]
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+            results = []
+            for srv, outcome in zip(servers, outcomes):
+                if isinstance(outcome, Exception):
+                    outcome = ServerLatencyResult(
+                        server=srv, success=False, error=str(outcome)
+                    )
+                elif isinstance(outcome, BaseException):
+                    raise outcome  # cancellation, KeyboardInterrupt, SystemExit
+                results.append(outcome)
 
         results.sort(
             key=lambda r: (not r.success, r.latency_ms if r.success else float("inf"))
@@ -260,7 +292,7 @@ async def measure_loaded_latency(
     """
     from .stats import LatencyStats as LS  # avoid circular at module level
 
-    samples: List[float] = []
+    samples = array("d")
 
     try:
         async with websockets.connect(
@@ -6,9 +6,12 @@ Everything here is deterministic and easy to unit-test.
 """
 from __future__ import annotations
 
-import statistics
+import math
+import operator
+from array import array
 from dataclasses import dataclass, field
-from typing import List
+from functools import partial
+from typing import Dict, List, Sequence, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -19,7 +22,7 @@ from typing import List
 class LatencyStats:
     """Aggregated latency statistics computed from a list of samples."""
 
-    samples: List[float] = field(default_factory=list)
+    samples: Sequence[float] = field(default_factory=partial(array, "d"))
     min: float = 0.0
     max: float = 0.0
     mean: float = 0.0
@@ -32,11 +35,12 @@ class LatencyStats:
         if not self.samples:
             return
         self.count = len(self.samples)
-        self.min = min(self.samples)
-        self.max = max(self.samples)
-        self.mean = statistics.mean(self.samples)
-        self.median = statistics.median(self.samples)
-        self.iqm = calculate_iqm(self.samples)
+        bundle = calculate_stats_bundle(self.samples)
+        self.min = bundle["min"]
+        self.max = bundle["max"]
+        self.mean = bundle["mean"]
+        self.median = bundle["median"]
+        self.iqm = bundle["iqm"]
         self.jitter = calculate_jitter(self.samples)
 
     def to_dict(self) -> dict:
@@ -60,7 +64,7 @@ class SpeedStats:
     duration_ms: float = 0.0
     speed_bps: float = 0.0
     speed_mbps: float = 0.0
-    samples: List[float] = field(default_factory=list)
+    samples: Sequence[float] = field(default_factory=partial(array, "d"))
 
     def calculate(self) -> None:
         if self.duration_ms > 0:
@@ -111,33 +115,71 @@ class ConnectionStats:
 
 def calculate_jitter(samples: List[float]) -> float:
     """Mean absolute difference between consecutive samples (Ookla method)."""
-    if len(samples) < 2:
+    n = len(samples)
+    if n < 2:
         return 0.0
-    diffs = [abs(samples[i] - samples[i - 1]) for i in range(1, len(samples))]
-    return statistics.mean(diffs)
+    return math.fsum(map(abs, map(operator.sub, samples[1:], samples))) / (n - 1)
 
 
 def calculate_iqm(samples: List[float]) -> float:
     """Interquartile mean -- mean of values between Q1 and Q3."""
-    if not samples:
+    n = len(samples)
+    if not n:
         return 0.0
-    if len(samples) < 4:
-        return statistics.mean(samples)
+    if n < 4:
+        return math.fsum(samples) / n
 
-    ordered = sorted(samples)
-    n = len(ordered)
-    q1 = n // 4
-    q3 = (3 * n) // 4
-    middle = ordered[q1:q3]
-    return statistics.mean(middle) if middle else statistics.mean(samples)
+    # sorted() is Timsort: already-monotone or mostly-ordered sample streams
+    # are detected as runs and merged in ~O(n), so a Python quickselect
+    # would only add interpreter overhead.
+    return _iqm_sorted(sorted(samples))
 
 
 def calculate_percentile(samples: List[float], percentile: float) -> float:
     """Linear-interpolation percentile."""
     if not samples:
         return 0.0
+    return _interpolate(sorted(samples), percentile)
 
+
+def calculate_stats_bundle(
+    samples: List[float], percentiles: Sequence[float] = ()
+) -> Dict[str, float]:
+    """
+    min / max / mean / median / iqm plus any requested percentiles, from a
+    single sort.  Percentile keys drop the decimal point (99.9 -> ``p999``).
+    """
+    keys = [f"p{p:g}".replace(".", "") for p in percentiles]
+    if not samples:
+        return dict.fromkeys(["min", "max", "mean", "median", "iqm", *keys], 0.0)
     ordered = sorted(samples)
+    n = len(ordered)
+    bundle = {
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": math.fsum(ordered) / n,
+        "median": _interpolate(ordered, 50),
+        "iqm": _iqm_sorted(ordered) if n >= 4 else math.fsum(ordered) / n,
+    }
+    for key, p in zip(keys, percentiles):
+        bundle[key] = _interpolate(ordered, p)
+    return bundle
+
+
+def quick_stats(samples: Sequence[float]) -> Tuple[float, float, float, float]:
+    """``(min, max, mean, median)`` -- the display subset of the stats bundle."""
+    bundle = calculate_stats_bundle(samples)
+    return bundle["min"], bundle["max"], bundle["mean"], bundle["median"]
+
+
+def _iqm_sorted(ordered: List[float]) -> float:
+    n = len(ordered)
+    q1 = n // 4
+    q3 = (3 * n) // 4
+    return math.fsum(ordered[q1:q3]) / (q3 - q1)
+
+
+def _interpolate(ordered: List[float], percentile: float) -> float:
     n = len(ordered)
     idx = (percentile / 100) * (n - 1)
     lower = int(idx)
@@ -152,13 +194,9 @@ def calculate_percentile(samples: List[float], percentile: float) -> float:
 
 def format_speed(speed_mbps: float) -> str:
     """Human-readable speed string."""
-    if speed_mbps >= 1000:
-        return f"{speed_mbps / 1000:.2f} Gbps"
-    return f"{speed_mbps:.2f} Mbps"
+    return f"{speed_mbps / 1000:.2f} Gbps" if speed_mbps >= 1000 else f"{speed_mbps:.2f} Mbps"
 
 
 def format_latency(latency_ms: float) -> str:
     """Human-readable latency string."""
-    if latency_ms >= 1000:
-        return f"{latency_ms / 1000:.2f} s"
-    return f"{latency_ms:.1f} ms"
+    return f"{latency_ms / 1000:.2f} s" if latency_ms >= 1000 else f"{latency_ms:.1f} ms"
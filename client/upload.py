@@ -8,10 +8,13 @@ and EMA-smoothed progress callback.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import os
 import time
+from array import array
 from dataclasses import dataclass, field
-from typing import Callable, List, Optional
+from functools import partial
+from typing import AsyncIterator, Callable, List, Optional, Sequence
 
 import aiohttp
 
@@ -29,6 +32,10 @@ from .constants import (
 )
 from .stats import ConnectionStats, LatencyStats, calculate_iqm
 
+# Per-request settings, so they also apply on a session shared with the API
+_HEADERS = {"Content-Type": "application/octet-stream"}
+_TIMEOUT = aiohttp.ClientTimeout(total=None, connect=5, sock_read=5)
+
 
 # ---------------------------------------------------------------------------
 # Result
@@ -44,7 +51,7 @@ class UploadResult:
     duration_ms: float = 0.0
     connections: List[ConnectionStats] = field(default_factory=list)
     loaded_latency: Optional[LatencyStats] = None
-    samples: List[float] = field(default_factory=list)
+    samples: Sequence[float] = field(default_factory=partial(array, "d"))
 
     def calculate(self) -> None:
         """Derive speed from total bytes and wall-clock duration."""
@@ -89,10 +96,18 @@ class UploadTester:
     coroutine records throughput every ``SAMPLE_INTERVAL`` seconds,
     discarding the first ``WARMUP_SECONDS``.  The final speed is the IQM
     of the post-warmup samples.
+
+    Pass an existing *session* (e.g. ``SpeedtestAPI.session``) to reuse its
+    connection pool; otherwise a dedicated session is opened per test.
     """
 
-    def __init__(self, duration_seconds: float = 15.0) -> None:
+    def __init__(
+        self,
+        duration_seconds: float = 15.0,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
         self.duration_seconds = duration_seconds
+        self.session = session
         self._data_buffer = os.urandom(UPLOAD_BUFFER_SIZE)
         self.on_progress: Optional[Callable[[float, float], None]] = None
 
@@ -101,7 +116,7 @@ class UploadTester:
 
         result = UploadResult()
         total_bytes = 0
-        speed_samples: List[float] = []
+        speed_samples = array("d")  # unboxed doubles, appended per sample
         conn_stats: List[ConnectionStats] = []
 
         start_time = time.perf_counter()
@@ -140,7 +155,12 @@ class UploadTester:
 
             while not stop.is_set() and time.perf_counter() < end_time:
                 try:
-                    async with session.post(server.upload_url, data=_data_stream()) as resp:
+                    async with session.post(
+                        server.upload_url,
+                        data=_data_stream(),
+                        headers=_HEADERS,
+                        timeout=_TIMEOUT,
+                    ) as resp:
                         await resp.read()
                 except asyncio.CancelledError:
                     break
@@ -194,21 +214,7 @@ class UploadTester:
 
         # -- Orchestration --------------------------------------------------
 
-        connector = aiohttp.TCPConnector(
-            ssl=True,
-            limit=connections,
-            limit_per_host=connections,
-            force_close=False,
-            enable_cleanup_closed=True,
-        )
-        timeout = aiohttp.ClientTimeout(total=None, connect=5, sock_read=5)
-        headers = {**COMMON_HEADERS, "Content-Type": "application/octet-stream"}
-
-        async with aiohttp.ClientSession(
-            headers=headers,
-            connector=connector,
-            timeout=timeout,
-        ) as session:
+        async with self._open_session(connections) as session:
             workers = [asyncio.create_task(_worker(session, i)) for i in range(connections)]
             sampler = asyncio.create_task(_sampler())
 
@@ -251,3 +257,24 @@ class UploadTester:
         result.calculate_from_samples()
 
         return result
+
+    @contextlib.asynccontextmanager
+    async def _open_session(self, connections: int) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the shared session, or a dedicated one sized to *connections*."""
+        if self.session is not None:
+            yield self.session
+            return
+
+        connector = aiohttp.TCPConnector(
+            ssl=True,
+            limit=connections,
+            limit_per_host=connections,
+            force_close=False,
+            enable_cleanup_closed=True,
+        )
+        async with aiohttp.ClientSession(
+            headers=COMMON_HEADERS,
+            connector=connector,
+            timeout=_TIMEOUT,
+        ) as session:
+            yield session
@@ -18,14 +18,13 @@ Usage::
 from __future__ import annotations
 
 import argparse
-import asyncio
-import json
+import functools
 import sys
 import time
-from typing import Optional
+from typing import Any, Coroutine, Dict, Optional, TextIO
 
-from client.api import SpeedtestAPI
 from client.constants import (
+    AUTO_CONNECTION_RTT_MS,
     DEFAULT_CONNECTIONS,
     DEFAULT_DURATION,
     DEFAULT_PING_COUNT,
@@ -36,34 +35,24 @@ from client.constants import (
     MIN_DURATION,
     MIN_PING_COUNT,
 )
-from client.download import DownloadTester
-from client.grading import (
-    compare_with_previous,
-    format_delta,
-    format_share_text,
-    grade_speed,
-)
-from client.history import load_history, save_result
-from client.latency import LatencyTester
-from client.upload import UploadTester
-from ui.dashboard import (
-    ProgressDisplay,
-    console,
-    print_client_info,
-    print_final_results,
-    print_header,
-    print_history,
-    print_latency_details,
-    print_server_selection,
-    print_speed_result,
-)
-from ui.output import create_result_json, format_csv_header, format_csv_row, save_json
+
+# asyncio, the networking clients and the rich-based dashboard are imported
+# inside the functions that use them, so ``--help`` doesn't pay for them.
 
 
 # ---------------------------------------------------------------------------
 # Parameter validation
 # ---------------------------------------------------------------------------
 
+# (label, lower bound, upper bound, unit suffix) -- same order as _validate()
+_RANGES = (
+    ("Ping count", MIN_PING_COUNT, MAX_PING_COUNT, ""),
+    ("Download duration", MIN_DURATION, MAX_DURATION, " s"),
+    ("Upload duration", MIN_DURATION, MAX_DURATION, " s"),
+    ("Connections", MIN_CONNECTIONS, MAX_CONNECTIONS, ""),
+)
+
+
 def _validate(
     ping_count: int,
     download_duration: float,
@@ -71,14 +60,21 @@ def _validate(
     connections: int,
 ) -> None:
     """Raise ``ValueError`` if any parameter is out of range."""
-    if not MIN_PING_COUNT <= ping_count <= MAX_PING_COUNT:
-        raise ValueError(f"Ping count must be between {MIN_PING_COUNT} and {MAX_PING_COUNT}")
-    if not MIN_DURATION <= download_duration <= MAX_DURATION:
-        raise ValueError(f"Download duration must be between {MIN_DURATION} and {MAX_DURATION} s")
-    if not MIN_DURATION <= upload_duration <= MAX_DURATION:
-        raise ValueError(f"Upload duration must be between {MIN_DURATION} and {MAX_DURATION} s")
-    if not MIN_CONNECTIONS <= connections <= MAX_CONNECTIONS:
-        raise ValueError(f"Connections must be between {MIN_CONNECTIONS} and {MAX_CONNECTIONS}")
+    values = (ping_count, download_duration, upload_duration, connections)
+    for value, (label, lo, hi, unit) in zip(values, _RANGES):
+        if not lo <= value <= hi:
+            raise ValueError(f"{label} must be between {lo} and {hi}{unit}")
+
+
+def _auto_connections(latency_ms: float) -> int:
+    """
+    Pick a connection count for the measured *latency_ms*.
+
+    Longer round-trips need more parallel streams to fill the
+    bandwidth-delay product; low-latency links are saturated by the default.
+    """
+    wanted = int(latency_ms / AUTO_CONNECTION_RTT_MS)
+    return max(DEFAULT_CONNECTIONS, min(wanted, MAX_CONNECTIONS))
 
 
 # ---------------------------------------------------------------------------
@@ -95,25 +91,61 @@ async def run_speedtest(
     ping_count: int = DEFAULT_PING_COUNT,
     download_duration: float = DEFAULT_DURATION,
     upload_duration: float = DEFAULT_DURATION,
-    connections: int = DEFAULT_CONNECTIONS,
+    connections: Optional[int] = DEFAULT_CONNECTIONS,
     plan_mbps: float = 0.0,
     share: bool = False,
     alert_below: float = 0.0,
+    previous_result: Optional[dict] = None,
 ) -> Optional[dict]:
-    """Execute the full speedtest sequence and return a JSON-serialisable dict."""
+    """
+    Execute the full speedtest sequence and return a JSON-serialisable dict.
+
+    *previous_result* is compared against instead of the last history entry
+    (repeat mode keeps it in memory).  ``connections=None`` picks the stream
+    count from the selected server's latency.
+    """
+    import asyncio
+    from itertools import islice
+
+    from client.api import SpeedtestAPI
+    from client.download import DownloadTester
+    from client.grading import (
+        compare_with_previous,
+        format_delta,
+        format_share_text,
+        grade_speed,
+    )
+    from client.history import load_history, save_result
+    from client.latency import LatencyTester
+    from client.upload import UploadTester
+    from ui.dashboard import (
+        ProgressDisplay,
+        console,
+        print_client_info,
+        print_final_results,
+        print_header,
+        print_latency_details,
+        print_server_selection,
+        print_speed_result,
+    )
+    from ui.output import create_result_json, save_json
 
     show_ui = not json_output and not simple
 
     if show_ui:
         print_header()
 
-    async with SpeedtestAPI() as api:
+    async with SpeedtestAPI(max_connections=max((connections or 0) * 2, MAX_CONNECTIONS)) as api:
 
-        # -- Client info ----------------------------------------------------
+        # -- Client info + server list --------------------------------------
         if show_ui:
-            console.print("[dim]Fetching client info...[/dim]")
+            console.print("[dim]Fetching client info and server list...[/dim]")
 
-        client_info = await api.get_client_info()
+        # Independent requests: overlap them rather than paying two round-trips.
+        client_info, servers = await asyncio.gather(
+            api.get_client_info(),
+            api.fetch_servers(limit=10),
+        )
 
         if show_ui:
             print_client_info(
@@ -122,12 +154,6 @@ async def run_speedtest(
                 location=client_info.country,
             )
 
-        # -- Server list ----------------------------------------------------
-        if show_ui:
-            console.print("[dim]Fetching server list...[/dim]")
-
-        servers = await api.fetch_servers(limit=10)
-
         if not servers:
             console.print("[red]Error: No servers available[/red]")
             return None
@@ -145,30 +171,52 @@ async def run_speedtest(
         latency_tester = LatencyTester(ping_count=ping_count)
         latency_results = await latency_tester.test_servers(servers)
 
-        ok_results = [r for r in latency_results if r.success]
-        if not ok_results:
+        # One pass for "any success?" and "fastest server"; don't rely on
+        # test_servers() ordering.
+        best = None
+        for r in latency_results:
+            if r.success and (best is None or r.latency_ms < best.latency_ms):
+                best = r
+        if best is None:
             console.print("[red]Error: Could not connect to any servers[/red]")
             return None
 
-        best = ok_results[0]
         best_server = best.server
 
+        # DNS + TLS to the chosen server overlaps with rendering the tables.
+        warm_up = asyncio.create_task(api.warm_up(best_server))
+
+        auto_connections = connections is None
+        if auto_connections:
+            connections = _auto_connections(best.latency_ms)
+
         if show_ui:
-            print_server_selection(latency_results, selected_idx=0)
-            console.print(
-                f"\n[green]Selected server:[/green] {best_server.name} ({best_server.sponsor})"
-            )
-            print_latency_details(best)
+            def _show_selection() -> None:
+                print_server_selection(latency_results, selected_idx=latency_results.index(best))
+                console.print(
+                    f"\n[green]Selected server:[/green] {best_server.name} ({best_server.sponsor})"
+                )
+                if best.pings:
+                    print_latency_details(best)
+                if auto_connections:
+                    console.print(
+                        f"[dim]Using {connections} connections "
+                        f"(auto, {best.latency_ms:.0f} ms latency)[/dim]"
+                    )
+
+            # Table layout is pure CPU; render in a worker thread so the event
+            # loop stays free for any network work scheduled around it.
+            await asyncio.to_thread(_show_selection)
+
+        await warm_up
 
         # -- Download -------------------------------------------------------
+        dl_tester = DownloadTester(duration_seconds=download_duration, session=api.session)
         if show_ui:
             console.print("\n[bold]Testing download speed...[/bold]")
             progress = ProgressDisplay()
             progress.start("Downloading")
-
-        dl_tester = DownloadTester(duration_seconds=download_duration)
-        if show_ui:
-            dl_tester.on_progress = lambda p, s: progress.update(p, s)
+            dl_tester.on_progress = progress.update
 
         dl_result = await dl_tester.test(best_server, connections=connections)
 
@@ -177,14 +225,12 @@ async def run_speedtest(
             print_speed_result(dl_result, "Download Results", "green")
 
         # -- Upload ---------------------------------------------------------
+        ul_tester = UploadTester(duration_seconds=upload_duration, session=api.session)
         if show_ui:
             console.print("\n[bold]Testing upload speed...[/bold]")
             progress = ProgressDisplay()
             progress.start("Uploading")
-
-        ul_tester = UploadTester(duration_seconds=upload_duration)
-        if show_ui:
-            ul_tester.on_progress = lambda p, s: progress.update(p, s)
+            ul_tester.on_progress = progress.update
 
         ul_result = await ul_tester.test(best_server, connections=connections)
 
@@ -224,17 +270,21 @@ async def run_speedtest(
                 print(f"Packet Loss: {best.packet_loss:.1f}%")
 
         # -- JSON result ----------------------------------------------------
+        best_dict = best.to_dict()
         result_json = create_result_json(
             client_info=client_info.to_dict(),
             server_info=best_server.to_dict(),
-            latency_results=best.to_dict(),
+            latency_results=best_dict,
             download_results=dl_result.to_dict(),
             upload_results=ul_result.to_dict(),
-            server_selection=[r.to_dict() for r in latency_results[:10]],
+            server_selection=[
+                best_dict if r is best else r.to_dict()
+                for r in islice(latency_results, 10)
+            ],
         )
 
         if json_output:
-            print(json.dumps(result_json, indent=2))
+            _write_json_stdout(result_json)
 
         if output_file:
             save_json(result_json, output_file)
@@ -258,7 +308,10 @@ async def run_speedtest(
 
         # -- Compare with previous ------------------------------------------
         if show_ui:
-            previous = load_history(limit=1)
+            if previous_result is not None:
+                previous = [previous_result]
+            else:
+                previous = load_history(limit=1)
             delta = compare_with_previous(result_json, previous)
             if delta:
                 console.print(
@@ -318,6 +371,41 @@ async def run_speedtest(
         return result_json
 
 
+def _write_json_stdout(result_json: Dict[str, Any]) -> None:
+    """Print *result_json* to stdout -- pretty for a terminal, compact in a pipe."""
+    indent = sys.stdout.isatty()
+    buffer = getattr(sys.stdout, "buffer", None)
+    encoding = (getattr(sys.stdout, "encoding", None) or "").lower().replace("-", "")
+    if buffer is None or encoding != "utf8":
+        # Text-only stream (redirect_stdout to StringIO, IDLE, Jupyter) or a
+        # non-UTF-8 console: escape to ASCII so any encoding can print it.
+        import json
+
+        if indent:
+            text = json.dumps(result_json, indent=2)
+        else:
+            text = json.dumps(result_json, separators=(",", ":"))
+        sys.stdout.write(text + "\n")
+        return
+
+    from ui.output import dumps_json
+
+    sys.stdout.flush()
+    buffer.write(dumps_json(result_json, indent=indent) + b"\n")
+    buffer.flush()
+
+
+# CSV files stay open for the life of the process, so repeat mode doesn't
+# reopen the file every run.  Line buffering still puts each row on disk.
+_csv_handles: Dict[str, TextIO] = {}
+
+
+def _close_csv_handles() -> None:
+    for fh in _csv_handles.values():
+        fh.close()
+    _csv_handles.clear()
+
+
 def _append_csv(
     path: str,
     server_name: str,
@@ -329,20 +417,46 @@ def _append_csv(
     upload_mbps: float,
 ) -> None:
     """Append a single CSV row, writing the header if the file is new."""
+    import atexit
     import os
 
-    write_header = not os.path.isfile(path) or os.path.getsize(path) == 0
-    with open(path, "a", encoding="utf-8") as fh:
+    from ui.output import format_csv_header, format_csv_row
+
+    key = os.path.abspath(path)
+    fh = _csv_handles.get(key)
+    if fh is None:
+        write_header = not os.path.isfile(path) or os.path.getsize(path) == 0
+        fh = open(path, "a", encoding="utf-8", buffering=1)
+        if not _csv_handles:
+            atexit.register(_close_csv_handles)
+        _csv_handles[key] = fh
         if write_header:
             fh.write(format_csv_header() + "\n")
-        fh.write(format_csv_row(server_name, isp, ip, ping_ms, jitter_ms, download_mbps, upload_mbps) + "\n")
+    fh.write(format_csv_row(server_name, isp, ip, ping_ms, jitter_ms, download_mbps, upload_mbps) + "\n")
+
+
+# ---------------------------------------------------------------------------
+# Event loop
+# ---------------------------------------------------------------------------
+
+def _run(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run *coro* to completion, on uvloop when it is installed."""
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError:  # not installed, or Windows (keeps the proactor loop)
+        return asyncio.run(coro)
+    return uvloop.run(coro)  # the "fast" extra pins uvloop>=0.18, which has run()
 
 
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
 
-def main() -> None:
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the argument parser on first use; later calls reuse it."""
     parser = argparse.ArgumentParser(
         description="Speedtest CLI -- Advanced network speed testing",
     )
@@ -361,7 +475,7 @@ def main() -> None:
     parser.add_argument("--ping-count", type=int, default=DEFAULT_PING_COUNT, metavar="N", help="Number of ping samples (default: 10)")
     parser.add_argument("--download-duration", type=float, default=DEFAULT_DURATION, metavar="SECS", help="Download test duration in seconds (default: 10)")
     parser.add_argument("--upload-duration", type=float, default=DEFAULT_DURATION, metavar="SECS", help="Upload test duration in seconds (default: 10)")
-    parser.add_argument("--connections", type=int, default=DEFAULT_CONNECTIONS, metavar="N", help="Number of concurrent connections (default: 4)")
+    parser.add_argument("--connections", type=int, default=None, metavar="N", help="Number of concurrent connections (default: auto, 4-32 by latency)")
 
     # Repeat mode
     parser.add_argument("--repeat", type=int, default=1, metavar="N", help="Run the test N times (default: 1)")
@@ -379,11 +493,17 @@ def main() -> None:
     parser.add_argument("--config", action="store_true", help="Show current config and exit")
     parser.add_argument("--set", nargs=2, metavar=("KEY", "VALUE"), help="Set a config value (e.g., --set plan 100)")
 
-    args = parser.parse_args()
+    return parser
+
+
+def main() -> None:
+    args = _get_parser().parse_args()
 
-    # Config mode
     from client.config import load_config, set_config_value, config_path
+    from client.history import load_history
+    from ui.dashboard import console, print_history
 
+    # Config mode
     if args.config:
         cfg = load_config()
         console.print(f"\n[bold]Config file:[/bold] {config_path()}\n")
@@ -434,42 +554,47 @@ def main() -> None:
             print_hourly_analysis(rows)
         return
 
-    # Validate
+    # List-servers mode
+    if args.list_servers:
+        from client.api import SpeedtestAPI
+
+        async def _list() -> None:
+            servers = await SpeedtestAPI.fetch_servers_oneshot(limit=20)
+            console.print("\n[bold]Available Servers:[/bold]\n")
+            # One print for all rows; server names are data, not markup.
+            console.print(
+                "\n".join(
+                    f"  {s.id:>6} | {s.name:<20} | {s.sponsor:<30} | {s.distance:.0f} km"
+                    for s in servers
+                ),
+                markup=False,
+            )
+        _run(_list())
+        return
+
+    # Only a test run uses these values; the other modes ignore them.
     try:
         _validate(
             ping_count=args.ping_count,
             download_duration=args.download_duration,
             upload_duration=args.upload_duration,
-            connections=args.connections,
+            connections=args.connections if args.connections is not None else DEFAULT_CONNECTIONS,
         )
+        if args.repeat < 1:
+            raise ValueError("--repeat must be >= 1")
     except ValueError as exc:
-        console.print(f"[red]Error: {exc}[/red]")
+        print(f"Error: {exc}", file=sys.stderr)
         sys.exit(1)
 
-    if args.repeat < 1:
-        console.print("[red]Error: --repeat must be >= 1[/red]")
-        sys.exit(1)
-
-    # List-servers mode
-    if args.list_servers:
-        async def _list() -> None:
-            async with SpeedtestAPI() as api:
-                servers = await api.fetch_servers(limit=20)
-                console.print("\n[bold]Available Servers:[/bold]\n")
-                for s in servers:
-                    console.print(
-                        f"  {s.id:>6} | {s.name:<20} | {s.sponsor:<30} | {s.distance:.0f} km"
-                    )
-        asyncio.run(_list())
-        return
-
-    # Normal run (with repeat support)
+    # Normal run (with repeat support).  Each run is appended to history as
+    # it completes and compared against the previous run in memory.
+    previous: Optional[dict] = None
     try:
         for run_idx in range(args.repeat):
             if args.repeat > 1:
                 console.print(f"\n[bold cyan]--- Run {run_idx + 1}/{args.repeat} ---[/bold cyan]")
 
-            asyncio.run(
+            result = _run(
                 run_speedtest(
                     json_output=args.json,
                     output_file=args.output,
@@ -483,8 +608,11 @@ def main() -> None:
                     plan_mbps=plan_mbps,
                     share=args.share,
                     alert_below=alert_below,
+                    previous_result=previous,
                 )
             )
+            if result is not None:
+                previous = result
 
             # Wait between runs (but not after the last one)
             if run_idx < args.repeat - 1:
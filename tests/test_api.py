@@ -0,0 +1,46 @@
+"""Tests for the Speedtest.net API client helpers."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from client.api import _async_ttl_cache
+
+
+class _Fetcher:
+    def __init__(self):
+        self.calls = 0
+
+    @_async_ttl_cache(60.0)
+    async def fetch(self, limit):
+        self.calls += 1
+        return [limit] * limit
+
+
+class TestAsyncTtlCache(unittest.TestCase):
+    def setUp(self):
+        _Fetcher.fetch.cache_clear()
+
+    def test_hit_is_shared_across_instances(self):
+        a, b = _Fetcher(), _Fetcher()
+        self.assertEqual(asyncio.run(a.fetch(2)), [2, 2])
+        self.assertEqual(asyncio.run(b.fetch(2)), [2, 2])
+        self.assertEqual((a.calls, b.calls), (1, 0))
+
+    def test_keyed_on_arguments(self):
+        f = _Fetcher()
+        asyncio.run(f.fetch(1))
+        asyncio.run(f.fetch(3))
+        self.assertEqual(f.calls, 2)
+
+    def test_expired_entry_refetches(self):
+        f = _Fetcher()
+        with mock.patch("client.api.time.monotonic", return_value=0.0):
+            asyncio.run(f.fetch(1))
+        with mock.patch("client.api.time.monotonic", return_value=61.0):
+            asyncio.run(f.fetch(1))
+        self.assertEqual(f.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Tests for the CLI helpers in speedtest.py."""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from speedtest import (
+    _append_csv, _auto_connections, _close_csv_handles, _validate, _write_json_stdout, main,
+)
+
+
+class TestValidate(unittest.TestCase):
+    def test_defaults_pass(self):
+        _validate(ping_count=10, download_duration=10.0, upload_duration=10.0, connections=4)
+
+    def test_bounds_are_inclusive(self):
+        _validate(ping_count=1, download_duration=1.0, upload_duration=300.0, connections=32)
+
+    def test_ping_count_message(self):
+        with self.assertRaisesRegex(ValueError, r"^Ping count must be between 1 and 100$"):
+            _validate(ping_count=0, download_duration=10.0, upload_duration=10.0, connections=4)
+
+    def test_duration_message_has_unit(self):
+        with self.assertRaisesRegex(ValueError, r"^Upload duration must be between 1.0 and 300.0 s$"):
+            _validate(ping_count=10, download_duration=10.0, upload_duration=301.0, connections=4)
+
+    def test_connections_message(self):
+        with self.assertRaisesRegex(ValueError, r"^Connections must be between 1 and 32$"):
+            _validate(ping_count=10, download_duration=10.0, upload_duration=10.0, connections=33)
+
+
+class TestMainValidation(unittest.TestCase):
+    def test_history_mode_ignores_test_parameters(self):
+        argv = ["speedtest.py", "--history", "--connections", "99"]
+        with mock.patch("sys.argv", argv), \
+                mock.patch("client.history.load_history", return_value=[]) as load, \
+                mock.patch("ui.dashboard.print_history"):
+            main()
+        load.assert_called_once()
+
+    def test_test_run_still_validates(self):
+        argv = ["speedtest.py", "--connections", "99"]
+        with mock.patch("sys.argv", argv), \
+                mock.patch("sys.stderr", io.StringIO()) as err, \
+                mock.patch("speedtest._run") as run:
+            with self.assertRaises(SystemExit):
+                main()
+        run.assert_not_called()
+        self.assertIn("Connections must be between", err.getvalue())
+
+
+class TestAutoConnections(unittest.TestCase):
+    def test_low_latency_uses_default(self):
+        self.assertEqual(_auto_connections(5.0), 4)
+
+    def test_scales_with_latency(self):
+        self.assertEqual(_auto_connections(120.0), 12)
+
+    def test_capped_at_max(self):
+        self.assertEqual(_auto_connections(900.0), 32)
+
+
+class TestWriteJsonStdout(unittest.TestCase):
+    def test_text_stream_without_buffer(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            _write_json_stdout({"server": "Łódź"})
+        self.assertEqual(json.loads(out.getvalue()), {"server": "Łódź"})
+
+    def test_non_latin1_name_on_cp1252_stream(self):
+        raw = io.BytesIO()
+        out = io.TextIOWrapper(raw, encoding="cp1252")
+        with contextlib.redirect_stdout(out):
+            _write_json_stdout({"sponsor": "Łódź"})
+        out.flush()
+        self.assertEqual(json.loads(raw.getvalue().decode("cp1252")), {"sponsor": "Łódź"})
+
+
+class TestAppendCsv(unittest.TestCase):
+    def tearDown(self):
+        _close_csv_handles()
+
+    def test_header_written_once(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "log.csv")
+            for _ in range(2):
+                _append_csv(path, "Srv", "ISP", "1.2.3.4", 10.0, 1.0, 100.0, 50.0)
+            with open(path, encoding="utf-8") as fh:
+                lines = fh.read().splitlines()
+            _close_csv_handles()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("timestamp,"))
+
+    def test_existing_file_gets_no_header(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "log.csv")
+            with open(path, "w", encoding="utf-8") as fh:
+                fh.write("existing\n")
+            _append_csv(path, "Srv", "ISP", "1.2.3.4", 10.0, 1.0, 100.0, 50.0)
+            _close_csv_handles()
+            with open(path, encoding="utf-8") as fh:
+                lines = fh.read().splitlines()
+        self.assertEqual(lines[0], "existing")
+        self.assertEqual(len(lines), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""Tests for dashboard helpers that don't need a terminal."""
+
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+from ui.dashboard import ProgressDisplay, _histogram, create_histogram
+
+
+class TestCreateHistogram(unittest.TestCase):
+    def test_empty(self):
+        self.assertEqual(create_histogram([]), "No data")
+
+    def test_ramp_uses_full_range(self):
+        self.assertEqual(create_histogram([0, 1, 2, 3, 4, 5, 6, 7]), "▁▂▃▄▅▆▇█")
+
+    def test_extremes(self):
+        bars = create_histogram([10.0, 55.0, 100.0])
+        self.assertEqual(bars[0], "▁")
+        self.assertEqual(bars[-1], "█")
+        self.assertEqual(len(bars), 3)
+
+    def test_irregular_max_reaches_top_bar(self):
+        self.assertEqual(create_histogram([0.0, 98.40731343280434]), "▁█")
+        values = [3.3, 17.123456789, 98.40731343280434, 41.9]
+        self.assertEqual(create_histogram(values)[2], "█")
+
+    def test_single_value(self):
+        self.assertEqual(create_histogram([42.0]), "▁")
+
+    def test_accepts_generator_and_array(self):
+        from array import array
+        self.assertEqual(create_histogram(v for v in (0.0, 7.0)), "▁█")
+        self.assertEqual(create_histogram(array("d", [0.0, 7.0])), "▁█")
+
+    def test_downsamples_to_width(self):
+        values = [float(v // 10) for v in range(80)]  # 0 x10, 1 x10, ... 7 x10
+        self.assertEqual(create_histogram(values, width=8), "▁▂▃▄▅▆▇█")
+        self.assertEqual(len(create_histogram(values)), 40)
+        self.assertEqual(len(create_histogram(values, width=80)), 80)
+
+    def test_histogram_reports_raw_extremes(self):
+        values = [5.0] * 39 + [100.0] + [1.0]  # spike averaged away at width 4
+        bars, lo, hi = _histogram(values, 4)
+        self.assertEqual(len(bars), 4)
+        self.assertEqual((lo, hi), (1.0, 100.0))
+        self.assertEqual(_histogram([], 4), ("No data", 0.0, 0.0))
+
+    def test_constant_values(self):
+        self.assertEqual(create_histogram([5.0, 5.0, 5.0]), "▁▁▁")
+        self.assertEqual(create_histogram([5.0] * 100, width=10), "▁" * 10)
+
+
+class TestProgressDisplayDebounce(unittest.TestCase):
+    def _display(self):
+        display = ProgressDisplay()
+        display.progress = mock.Mock()
+        display.start("Download")
+        return display
+
+    def test_skips_updates_within_same_bucket(self):
+        display = self._display()
+        display.update(0.101, 50.2)
+        display.update(0.104, 50.2)
+        display.update(0.105, 50.201)
+        self.assertEqual(display.progress.update.call_count, 1)
+
+    def test_speed_change_refreshes_label(self):
+        display = self._display()
+        display.update(0.10, 50.0)
+        display.update(0.10, 51.0)
+        self.assertEqual(display.progress.update.call_count, 2)
+        self.assertEqual(display.progress.update.call_args.kwargs["speed"], "51.00 Mbps")
+
+    def test_sub_megabit_speed_is_not_frozen(self):
+        display = self._display()
+        for progress, speed in ((0.10, 0.45), (0.11, 0.93), (0.12, 0.55)):
+            display.update(progress, speed)
+        self.assertEqual(display.progress.update.call_args.kwargs["speed"], "0.55 Mbps")
+
+
+class TestPrintServerSelection(unittest.TestCase):
+    def test_cells_formatted_per_result(self):
+        from types import SimpleNamespace
+
+        from ui.dashboard import get_console, print_server_selection
+
+        def result(name, ok):
+            server = SimpleNamespace(name=name, sponsor="", distance=12.4)
+            return SimpleNamespace(server=server, success=ok, latency_ms=8.25, jitter_ms=0.5)
+
+        with get_console().capture() as cap:
+            print_server_selection([result("Up", True), result("Down", False)])
+        out = cap.get()
+        self.assertIn("12 km", out)
+        self.assertIn("8.2 ms", out)
+        self.assertIn("0.50 ms", out)
+        self.assertEqual(out.count("N/A"), 2)
+
+
+class TestPrintSpeedResult(unittest.TestCase):
+    def test_connection_megabytes_use_exact_division(self):
+        from types import SimpleNamespace
+
+        from ui.dashboard import get_console, print_speed_result
+
+        conn = SimpleNamespace(id=0, hostname="h", bytes_transferred=49_850_000, speed_mbps=10.0)
+        result = SimpleNamespace(
+            speed_mbps=10.0, bytes_total=1_000_000, duration_ms=1000.0,
+            connections=[conn], loaded_latency=None, samples=[],
+        )
+        with get_console().capture() as cap:
+            print_speed_result(result, "Download")
+        # 49_850_000 * 1e-6 would round to 49.8; the true quotient is 49.85
+        self.assertIn("49.9 MB", cap.get())
+
+
+class TestLazyRich(unittest.TestCase):
+    def test_import_does_not_load_rich(self):
+        code = (
+            "import sys, ui.dashboard as d; "
+            "assert not any(m.startswith('rich') for m in sys.modules); "
+            "d.console.print; "
+            "assert 'rich.console' in sys.modules"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
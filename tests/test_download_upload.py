@@ -4,7 +4,10 @@ import unittest
 
 from client.download import DownloadResult
 from client.upload import UploadResult
-from client.stats import ConnectionStats, LatencyStats, calculate_iqm
+from client.stats import (
+    ConnectionStats, LatencyStats, calculate_iqm, calculate_jitter,
+    calculate_stats_bundle, quick_stats,
+)
 
 
 class TestDownloadResultCalculate(unittest.TestCase):
@@ -60,6 +63,13 @@ class TestDownloadResultCalculate(unittest.TestCase):
         self.assertIn("loaded_latency", d)
         self.assertEqual(d["loaded_latency"]["count"], 3)
 
+    def test_array_samples_serialise_as_list(self):
+        r = DownloadResult(bytes_total=1, duration_ms=1)
+        r.samples.extend([90.0, 110.0])
+        r.calculate_from_samples()
+        self.assertAlmostEqual(r.speed_mbps, 100.0)
+        self.assertEqual(r.to_dict()["samples"], [90.0, 110.0])
+
 
 class TestUploadResultCalculate(unittest.TestCase):
     def test_basic_speed(self):
@@ -104,6 +114,47 @@ class TestIqmFunction(unittest.TestCase):
         # Q1=25, Q3=75 -> middle is [26..75] -> mean = 50.5
         self.assertAlmostEqual(result, 50.5)
 
+    def test_order_independent(self):
+        ascending = [float(v) for v in range(1, 101)]
+        self.assertAlmostEqual(calculate_iqm(ascending[::-1]), 50.5)
+        self.assertAlmostEqual(calculate_iqm(ascending[50:] + ascending[:50]), 50.5)
+
+
+class TestJitterFunction(unittest.TestCase):
+    def test_too_few(self):
+        self.assertEqual(calculate_jitter([]), 0.0)
+        self.assertEqual(calculate_jitter([5.0]), 0.0)
+
+    def test_mean_abs_diff(self):
+        # diffs: 2, 1, 4 -> 7 / 3
+        self.assertAlmostEqual(calculate_jitter([1.0, 3.0, 2.0, 6.0]), 7 / 3)
+
+
+class TestStatsBundle(unittest.TestCase):
+    def test_empty(self):
+        bundle = calculate_stats_bundle([], (99.9,))
+        self.assertEqual(bundle["median"], 0.0)
+        self.assertEqual(bundle["p999"], 0.0)
+
+    def test_quick_stats_matches_bundle(self):
+        samples = [float(v) for v in (7, 1, 9, 3, 5, 2, 8, 4)]
+        bundle = calculate_stats_bundle(samples)
+        self.assertEqual(
+            quick_stats(samples),
+            (bundle["min"], bundle["max"], bundle["mean"], bundle["median"]),
+        )
+        self.assertEqual(quick_stats([]), (0.0, 0.0, 0.0, 0.0))
+
+    def test_matches_individual_helpers(self):
+        samples = [float(v) for v in (7, 1, 9, 3, 5, 2, 8, 4)]
+        bundle = calculate_stats_bundle(samples, (50, 90))
+        self.assertEqual(bundle["min"], 1.0)
+        self.assertEqual(bundle["max"], 9.0)
+        self.assertAlmostEqual(bundle["mean"], 39 / 8)
+        self.assertAlmostEqual(bundle["median"], 4.5)
+        self.assertAlmostEqual(bundle["p50"], 4.5)
+        self.assertAlmostEqual(bundle["iqm"], calculate_iqm(samples))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,45 @@
+"""Tests for grading and comparison helpers."""
+
+import unittest
+
+from client.grading import compare_with_previous, format_delta
+
+
+class TestCompareWithPrevious(unittest.TestCase):
+    def test_no_history(self):
+        self.assertIsNone(compare_with_previous({"ping": 10}, []))
+
+    def test_deltas_against_latest_entry(self):
+        current = {"ping": 12, "download": {"speed_mbps": 90}, "upload": {"speed_mbps": 20}}
+        history = [
+            {"ping": 99, "download": {"speed_mbps": 1}},
+            {"ping": 10, "download": {"speed_mbps": 100}, "upload": {"speed_mbps": 25}},
+        ]
+        delta = compare_with_previous(current, history)
+        self.assertEqual(delta["ping_delta"], 2)
+        self.assertEqual(delta["download_delta"], -10)
+        self.assertEqual(delta["upload_delta"], -5)
+        self.assertEqual(delta["prev_download"], 100)
+
+    def test_missing_or_malformed_fields(self):
+        delta = compare_with_previous({"download": "n/a"}, [{"ping": 5}])
+        self.assertEqual(delta["ping_delta"], -5)
+        self.assertEqual(delta["download_delta"], 0)
+        self.assertEqual(delta["upload_delta"], 0)
+
+
+class TestFormatDelta(unittest.TestCase):
+    def test_same(self):
+        self.assertEqual(format_delta(0.004, "ms"), "[dim](same)[/dim]")
+
+    def test_speed_up_is_green(self):
+        self.assertEqual(format_delta(12.34, "Mbps"), "[green]+12.3 Mbps[/green]")
+        self.assertEqual(format_delta(-5.0, "Mbps"), "[red]-5.0 Mbps[/red]")
+
+    def test_ping_inverted(self):
+        self.assertEqual(format_delta(-2.0, "ms", invert=True), "[green]-2.0 ms[/green]")
+        self.assertEqual(format_delta(3.0, "ms", invert=True), "[red]+3.0 ms[/red]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Tests for history persistence."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from client import history
+from client.history import load_history, save_result
+
+
+class TestSaveResult(unittest.TestCase):
+    def test_appends_one_line_per_call(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "history.jsonl")
+            with mock.patch("client.history._history_path", return_value=path):
+                for ping in (10, 20, 30):
+                    save_result({"ping": ping})
+                entries = load_history(limit=10)
+        self.assertEqual([e["ping"] for e in entries], [10, 20, 30])
+        self.assertTrue(all("timestamp" in e for e in entries))
+
+    def test_no_mutation(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "history.jsonl")
+            with mock.patch("client.history._history_path", return_value=path):
+                original = {"ping": 10}
+                save_result(original)
+                with open(path) as fh:
+                    self.assertIn("timestamp", json.loads(fh.readline()))
+        self.assertEqual(original, {"ping": 10})
+
+    def test_stdlib_fallback_writes_same_entries(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "history.jsonl")
+            with mock.patch("client.history._history_path", return_value=path):
+                with mock.patch.object(history, "orjson", None):
+                    save_result({"ping": 1, "server": {"name": "Zürich"}})
+                save_result({"ping": 2, "server": {"name": "Zürich"}})
+                entries = load_history(limit=10)
+            with open(path, encoding="utf-8") as fh:
+                self.assertEqual(fh.read().count("Zürich"), 2)
+        self.assertEqual([e["ping"] for e in entries], [1, 2])
+
+
+class TestLoadHistory(unittest.TestCase):
+    def test_returns_newest_limit_skipping_corrupt_lines(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "history.jsonl")
+            with open(path, "w") as fh:
+                fh.write('{"ping": 1}\n{"ping": 2}\n\n{"ping": 3}\nnot json\n')
+            with mock.patch("client.history._history_path", return_value=path):
+                self.assertEqual([e["ping"] for e in load_history(limit=2)], [2, 3])
+                self.assertEqual([e["ping"] for e in load_history(limit=10)], [1, 2, 3])
+
+    def test_missing_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "history.jsonl")
+            with mock.patch("client.history._history_path", return_value=path):
+                self.assertEqual(load_history(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
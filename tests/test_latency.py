@@ -0,0 +1,78 @@
+"""Tests for latency result handling and server ranking."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from client.api import Server
+from client.latency import LatencyTester, PingResult, ServerLatencyResult
+
+
+def _server(sid: int) -> Server:
+    return Server(
+        id=sid, name=f"S{sid}", sponsor="", hostname=f"h{sid}", port=8080,
+        country="", cc="", lat=0.0, lon=0.0, distance=0.0, url="",
+    )
+
+
+class TestTestServers(unittest.TestCase):
+    def test_sorted_and_exceptions_become_failures(self):
+        latencies = {1: 30.0, 2: 10.0, 3: None}
+
+        async def fake_test_server(srv):
+            if latencies[srv.id] is None:
+                raise RuntimeError("boom")
+            return ServerLatencyResult(server=srv, latency_ms=latencies[srv.id])
+
+        tester = LatencyTester()
+        with mock.patch.object(tester, "test_server", side_effect=fake_test_server):
+            results = asyncio.run(tester.test_servers([_server(i) for i in (1, 2, 3)]))
+
+        self.assertEqual([r.server.id for r in results], [2, 1, 3])
+        self.assertFalse(results[-1].success)
+        self.assertEqual(results[-1].error, "boom")
+
+    def test_non_exception_errors_propagate(self):
+        class Abort(BaseException):
+            pass
+
+        async def fake_test_server(srv):
+            if srv.id == 2:
+                raise Abort()
+            return ServerLatencyResult(server=srv, latency_ms=10.0)
+
+        tester = LatencyTester()
+        with mock.patch.object(tester, "test_server", side_effect=fake_test_server):
+            with self.assertRaises(Abort):
+                asyncio.run(tester.test_servers([_server(i) for i in (1, 2, 3)]))
+
+
+class TestWarmup(unittest.TestCase):
+    def _run(self, outcomes):
+        tester = LatencyTester(ping_count=3, warmup_pings=1)
+        ws = mock.MagicMock()
+        ws.__aenter__ = mock.AsyncMock(return_value=ws)
+        ws.__aexit__ = mock.AsyncMock(return_value=False)
+        ping = mock.AsyncMock(side_effect=outcomes)
+        with mock.patch("client.latency.websockets.connect", return_value=ws), \
+                mock.patch.object(tester, "_read_handshake", mock.AsyncMock()), \
+                mock.patch.object(tester, "_ping_once", ping):
+            return asyncio.run(tester.test_server(_server(1))), ping
+
+    def test_warmup_sample_is_discarded(self):
+        pings = [PingResult(latency_ms=v) for v in (90.0, 10.0, 12.0, 11.0)]
+        result, _ = self._run(pings)
+        self.assertTrue(result.success)
+        self.assertEqual(list(result.pings), [10.0, 12.0, 11.0])
+        self.assertEqual(result.latency_ms, 10.0)
+
+    def test_failed_warmup_marks_server_failed(self):
+        result, ping = self._run([PingResult(success=False, error="Ping timeout")])
+        self.assertFalse(result.success)
+        self.assertIn("Ping timeout", result.error)
+        self.assertEqual(ping.await_count, 1)
+        self.assertEqual(len(result.pings), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
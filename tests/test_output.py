@@ -0,0 +1,153 @@
+"""Tests for JSON / CSV output helpers."""
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+from ui import output
+from ui.output import create_result_json, dumps_json, save_json
+
+
+class TestDumpsJson(unittest.TestCase):
+    SAMPLE = {"ping": 12.5, "pings": [12.5, 13.0], "server": {"name": "Zürich"}}
+
+    def test_indented_round_trip(self):
+        data = dumps_json(self.SAMPLE)
+        self.assertIn(b"\n  ", data)
+        self.assertEqual(json.loads(data), self.SAMPLE)
+
+    def test_compact_has_no_whitespace(self):
+        data = dumps_json(self.SAMPLE, indent=False)
+        self.assertNotIn(b"\n", data)
+        self.assertNotIn(b", ", data)
+        self.assertEqual(json.loads(data), self.SAMPLE)
+
+    def test_stdlib_fallback_matches(self):
+        with mock.patch.object(output, "orjson", None):
+            fallback = dumps_json(self.SAMPLE)
+            fallback_compact = dumps_json(self.SAMPLE, indent=False)
+        self.assertEqual(json.loads(fallback), self.SAMPLE)
+        self.assertEqual(fallback_compact, dumps_json(self.SAMPLE, indent=False))
+        self.assertIn("Zürich".encode("utf-8"), fallback)
+
+
+class TestRttPercentiles(unittest.TestCase):
+    def _rtt(self, pings):
+        result = create_result_json(
+            client_info={},
+            server_info={},
+            latency_results={"pings": pings},
+            download_results={},
+            upload_results={},
+        )
+        return result["latency"]["tcp"]["rtt"]
+
+    def test_percentiles(self):
+        rtt = self._rtt([float(v) for v in range(1, 102)])  # 1..101
+        self.assertAlmostEqual(rtt["p50"], 51.0)
+        self.assertAlmostEqual(rtt["p90"], 91.0)
+        self.assertAlmostEqual(rtt["p99"], 100.0)
+        self.assertAlmostEqual(rtt["p999"], 100.9)
+
+    def test_pings_list_is_shared_not_copied(self):
+        pings = [10.0, 12.0, 11.0]
+        result = create_result_json({}, {}, {"pings": pings}, {}, {})
+        self.assertIs(result["pings"], pings)
+        self.assertIs(result["latency"]["tcp"]["samples"], pings)
+        self.assertEqual(result["latency"]["tcp"]["count"], 3)
+
+    def test_array_pings_serialise(self):
+        from array import array
+        result = create_result_json({}, {}, {"pings": array("d", [10.0, 12.0])}, {}, {})
+        self.assertEqual(json.loads(dumps_json(result))["pings"], [10.0, 12.0])
+        self.assertEqual(result["latency"]["tcp"]["rtt"]["max"], 12.0)
+
+    def test_empty_pings(self):
+        rtt = self._rtt([])
+        self.assertEqual((rtt["p50"], rtt["p99"], rtt["p999"]), (0.0, 0.0, 0.0))
+
+
+class TestTransferSections(unittest.TestCase):
+    def test_fields_and_defaults(self):
+        result = create_result_json(
+            client_info={},
+            server_info={},
+            latency_results={},
+            download_results={"speed_mbps": 95.5, "bytes_total": 1000, "samples": [95.5]},
+            upload_results={},
+        )
+        self.assertEqual(result["download"], {
+            "speed_bps": 0, "speed_mbps": 95.5, "bytes": 1000,
+            "duration_ms": 0, "connections": [], "samples": [95.5],
+        })
+        self.assertEqual(result["upload"]["bytes"], 0)
+        self.assertEqual(result["upload"]["samples"], [])
+
+
+class TestUtcTimestamp(unittest.TestCase):
+    def test_matches_isoformat(self):
+        with mock.patch.object(output.time, "time", return_value=1735732800.25):
+            ts = output._utc_timestamp()
+        expected = datetime.fromtimestamp(1735732800.25, timezone.utc).isoformat()
+        self.assertEqual(ts, expected)
+
+    def test_fraction_updates_within_cached_second(self):
+        with mock.patch.object(output.time, "time", side_effect=[1735732800.5, 1735732800.000001]):
+            first, second = output._utc_timestamp(), output._utc_timestamp()
+        self.assertEqual(first, "2025-01-01T12:00:00.500000+00:00")
+        self.assertEqual(second, "2025-01-01T12:00:00.000001+00:00")
+
+    def test_result_json_uses_timestamp(self):
+        with mock.patch.object(output, "_utc_timestamp", return_value="TS"):
+            result = create_result_json({}, {}, {}, {}, {})
+        self.assertEqual(result["timestamp"], "TS")
+
+    def test_csv_row_uses_timestamp(self):
+        with mock.patch.object(output, "_utc_timestamp", return_value="TS"):
+            row = output.format_csv_row("s", "i", "ip", 1.0, 2.0, 3.0, 4.0)
+        self.assertEqual(row, "TS,s,i,ip,1.0,2.00,3.00,4.00")
+
+
+class TestSaveJson(unittest.TestCase):
+    SAMPLE = {"ping": 12.5, "server": {"name": "Zürich"}}
+
+    def _round_trip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "result.json")
+            save_json(self.SAMPLE, path)
+            self.assertEqual(os.listdir(tmpdir), ["result.json"])
+            with open(path, encoding="utf-8") as fh:
+                return json.load(fh)
+
+    def test_round_trip(self):
+        self.assertEqual(self._round_trip(), self.SAMPLE)
+
+    def test_round_trip_stdlib(self):
+        with mock.patch.object(output, "orjson", None):
+            self.assertEqual(self._round_trip(), self.SAMPLE)
+
+    def test_non_atomic_writes_in_place(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "result.json")
+            with open(path, "w") as fh:
+                fh.write("x" * 1000)  # longer than the new content
+            with mock.patch.object(output.os, "replace") as replace:
+                save_json(self.SAMPLE, path, atomic=False)
+            replace.assert_not_called()
+            with open(path, encoding="utf-8") as fh:
+                self.assertEqual(json.load(fh), self.SAMPLE)
+
+    def test_write_error_cleans_up(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "result.json")
+            with mock.patch.object(output.os, "write", side_effect=OSError("disk full")):
+                with self.assertRaises(IOError):
+                    save_json(self.SAMPLE, path)
+            self.assertEqual(os.listdir(tmpdir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,39 +1,45 @@
-"""UI layer -- Rich dashboard and output formatters."""
-
-from .dashboard import (
-    ProgressDisplay,
-    console,
-    create_histogram,
-    print_client_info,
-    print_final_results,
-    print_header,
-    print_history,
-    print_latency_details,
-    print_server_selection,
-    print_speed_result,
-)
-from .output import (
-    create_result_json,
-    format_csv_header,
-    format_csv_row,
-    format_text_result,
-    save_json,
-)
-
-__all__ = [
-    "ProgressDisplay",
-    "console",
-    "create_histogram",
-    "create_result_json",
-    "format_csv_header",
-    "format_csv_row",
-    "format_text_result",
-    "print_client_info",
-    "print_final_results",
-    "print_header",
-    "print_history",
-    "print_latency_details",
-    "print_server_selection",
-    "print_speed_result",
-    "save_json",
-]
+"""
+UI layer -- Rich dashboard and output formatters.
+
+Names are resolved lazily (PEP 562) so that ``ui.output`` can be used
+without importing rich.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "ProgressDisplay": ".dashboard",
+    "console": ".dashboard",
+    "get_console": ".dashboard",
+    "create_histogram": ".dashboard",
+    "print_client_info": ".dashboard",
+    "print_final_results": ".dashboard",
+    "print_header": ".dashboard",
+    "print_history": ".dashboard",
+    "print_hourly_analysis": ".dashboard",
+    "print_latency_details": ".dashboard",
+    "print_server_selection": ".dashboard",
+    "print_speed_result": ".dashboard",
+    "create_result_json": ".output",
+    "dumps_json": ".output",
+    "format_csv_header": ".output",
+    "format_csv_row": ".output",
+    "format_text_result": ".output",
+    "save_json": ".output",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):  # noqa: ANN202
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():  # noqa: ANN202
+    return sorted(set(globals()) | set(__all__))
@@ -6,24 +6,45 @@ presentation via the ``rich`` library.
 """
 from __future__ import annotations
 
-import statistics
-from typing import List
-
-from rich import box
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    TimeElapsedColumn,
-)
-from rich.table import Table
+import math
+from collections.abc import Sequence
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
+
+from client.stats import format_speed, format_latency, quick_stats
+
+# rich is imported inside the functions that draw with it, and the console is
+# only built on first use: --json runs never import rich at all.
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+_console: Optional[Console] = None
+
+
+def get_console() -> Console:
+    """The shared ``rich`` console, created on first call."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
 
-from client.stats import format_speed, format_latency
 
-console = Console()
+class _LazyConsole:
+    """Forwards attribute access to :func:`get_console`."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str):  # noqa: ANN204
+        return getattr(get_console(), name)
+
+    def __setattr__(self, name: str, value) -> None:  # noqa: ANN001
+        setattr(get_console(), name, value)
+
+
+console = _LazyConsole()
 
 
 # ---------------------------------------------------------------------------
@@ -31,24 +52,75 @@ console = Console()
 # ---------------------------------------------------------------------------
 
 _BARS = "▁▂▃▄▅▆▇█"
-
-
-def create_histogram(values: List[float], width: int = 40, height: int = 5) -> str:
-    """Return a single-line Unicode bar-chart."""
-    if not values:
-        return "No data"
-
-    lo, hi = min(values), max(values)
-    span = hi - lo if hi > lo else 1.0
-    norm = [(v - lo) / span * height for v in values]
-    return "".join(_BARS[min(int(n * (len(_BARS) - 1) / height), len(_BARS) - 1)] for n in norm)
+_TOP_BAR = len(_BARS) - 1
+# Bar indices are packed into bytes and resolved in one str.translate call.
+_BAR_TRANS = str.maketrans({chr(i): bar for i, bar in enumerate(_BARS)})
+
+
+def create_histogram(values: Iterable[float], width: int = 40, height: int = 5) -> str:
+    """
+    Return a single-line Unicode bar-chart.
+
+    *values* may be any sequence (list, tuple, ``array('d')``) and is used as
+    is; other iterables are materialised once.  More than *width* values are
+    averaged down to *width* bars.  *height* is accepted for backward
+    compatibility; bars are always scaled over the full ``_BARS`` range.
+    """
+    return _histogram(values, width)[0]
+
+
+def _histogram(values: Iterable[float], width: int) -> Tuple[str, float, float]:
+    """``create_histogram`` plus the raw min and max it scanned for."""
+    if not isinstance(values, Sequence):
+        values = list(values)
+    n = len(values)
+    if n < 2:
+        # Nothing to scale against: a single sample sits on the bottom bar.
+        only = values[0] if n else 0.0
+        return _BARS[0] * n or "No data", only, only
+
+    lo, hi = raw_lo, raw_hi = min(values), max(values)
+    downsample = 0 < width < n
+    if lo == hi:
+        # Flat series (e.g. a stalled stream): every bar is the bottom one.
+        return _BARS[0] * (width if downsample else n), lo, hi
+    if downsample:
+        fsum = math.fsum  # local: looked up once, not once per bucket
+        edges = [i * n // width for i in range(width + 1)]
+        values = [fsum(values[a:b]) / (b - a) for a, b in zip(edges, edges[1:])]
+        lo, hi = min(values), max(values)  # width values, not n
+
+    span = hi - lo if hi > lo else 1.0  # bucket averages can still be flat
+    # Divide before scaling: (hi - lo) / span is exactly 1.0, so the maximum
+    # always lands on the top bar (a precomputed reciprocal can round it
+    # down).  The index -> bar lookup happens in C; the small-int list
+    # feeding bytes() is cheaper than a generator (bytes() pre-sizes from a
+    # list), and no normalised float list is ever built.
+    bars = bytes([int((v - lo) / span * _TOP_BAR) for v in values]).decode("latin-1").translate(_BAR_TRANS)
+    return bars, raw_lo, raw_hi
 
 
 # ---------------------------------------------------------------------------
 # Print helpers
 # ---------------------------------------------------------------------------
 
+_METRIC_COLUMNS = (("Metric", {"style": "bold"}), ("Value", {"justify": "right"}))
+
+
+def _metric_table(title: str) -> Table:
+    """Two-column Metric/Value table used by the latency and speed panels."""
+    from rich import box
+    from rich.table import Table
+
+    table = Table(title=title, box=box.ROUNDED)
+    for name, kwargs in _METRIC_COLUMNS:
+        table.add_column(name, **kwargs)
+    return table
+
+
 def print_header() -> None:
+    from rich.panel import Panel
+
     console.print()
     console.print(
         Panel.fit(
@@ -61,6 +133,9 @@ def print_header() -> None:
 
 
 def print_client_info(ip: str, isp: str, location: str = "") -> None:
+    from rich.panel import Panel
+    from rich.table import Table
+
     table = Table(show_header=False, box=None, padding=(0, 1))
     table.add_column(style="dim")
     table.add_column(style="bold")
@@ -72,6 +147,9 @@ def print_client_info(ip: str, isp: str, location: str = "") -> None:
 
 
 def print_server_selection(servers: list, selected_idx: int = 0) -> None:
+    from rich import box
+    from rich.table import Table
+
     table = Table(title="Server Selection", box=box.ROUNDED)
     table.add_column("#", style="dim", width=4)
     table.add_column("Server", style="bold")
@@ -80,59 +158,66 @@ def print_server_selection(servers: list, selected_idx: int = 0) -> None:
     table.add_column("Latency", justify="right")
     table.add_column("Jitter", justify="right")
 
-    for i, result in enumerate(servers[:10]):
-        style = "green" if i == selected_idx else None
-        marker = ">" if i == selected_idx else " "
-        table.add_row(
-            f"{marker}{i + 1}",
-            result.server.name,
-            result.server.sponsor,
-            f"{result.server.distance:.0f} km",
-            format_latency(result.latency_ms) if result.success else "N/A",
-            f"{result.jitter_ms:.2f} ms" if result.success else "N/A",
-            style=style,
+    rows = [
+        (
+            f"{'>' if i == selected_idx else ' '}{i + 1}",
+            r.server.name,
+            r.server.sponsor,
+            f"{r.server.distance:.0f} km",
+            format_latency(r.latency_ms) if r.success else "N/A",
+            f"{r.jitter_ms:.2f} ms" if r.success else "N/A",
         )
+        for i, r in enumerate(islice(servers, 10))
+    ]
+    add_row = table.add_row
+    for i, row in enumerate(rows):
+        add_row(*row, style="green" if i == selected_idx else None)
 
     console.print(table)
 
 
 def print_latency_details(result) -> None:  # noqa: ANN001 (ServerLatencyResult)
     """Print detailed latency statistics and a histogram."""
+    from rich.console import Group
+    from rich.panel import Panel
+
     pings = result.pings
 
     if not pings:
         console.print("[dim]No latency samples collected.[/dim]")
         return
 
-    table = Table(title="Latency Details", box=box.ROUNDED)
-    table.add_column("Metric", style="bold")
-    table.add_column("Value", justify="right")
+    table = _metric_table("Latency Details")
+
+    lo, hi, mean, median = quick_stats(pings)
 
-    table.add_row("Min", format_latency(min(pings)))
-    table.add_row("Max", format_latency(max(pings)))
-    table.add_row("Mean", format_latency(statistics.mean(pings)))
-    table.add_row("Median", format_latency(statistics.median(pings)))
+    table.add_row("Min", format_latency(lo))
+    table.add_row("Max", format_latency(hi))
+    table.add_row("Mean", format_latency(mean))
+    table.add_row("Median", format_latency(median))
     table.add_row("Jitter", f"{result.jitter_ms:.2f} ms")
     table.add_row("Packet Loss", f"{result.packet_loss:.1f}%")
     table.add_row("Samples", f"{len(pings)}/{result.ping_attempts}")
-    console.print(table)
 
-    console.print(
-        Panel(
-            f"[cyan]{create_histogram(pings, width=len(pings))}[/cyan]\n"
-            f"[dim]Min: {min(pings):.1f} ms  Max: {max(pings):.1f} ms[/dim]",
-            title="Ping Histogram",
-        )
+    histogram = Panel(
+        f"[cyan]{create_histogram(pings, width=len(pings))}[/cyan]\n"
+        f"[dim]Min: {lo:.1f} ms  Max: {hi:.1f} ms[/dim]",
+        title="Ping Histogram",
     )
+    console.print(Group(table, histogram))
 
 
 def print_speed_result(result, title: str, color: str = "green") -> None:  # noqa: ANN001
     """Print a download or upload result panel."""
-    table = Table(title=title, box=box.ROUNDED)
-    table.add_column("Metric", style="bold")
-    table.add_column("Value", justify="right")
+    from rich import box
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
 
-    table.add_row("Speed", f"[bold {color}]{format_speed(result.speed_mbps)}[/bold {color}]")
+    table = _metric_table(title)
+
+    table.add_row("Speed", Text.assemble((format_speed(result.speed_mbps), f"bold {color}")))
     table.add_row("Data Transferred", f"{result.bytes_total / 1_000_000:.1f} MB")
     table.add_row("Duration", f"{result.duration_ms / 1000:.1f} s")
     table.add_row("Connections", str(len(result.connections)))
@@ -142,14 +227,13 @@ def print_speed_result(result, title: str, color: str = "green") -> None:  # noq
         ll = result.loaded_latency
         table.add_row("Loaded Latency", f"{ll.mean:.1f} ms [dim](jitter: {ll.jitter:.2f} ms)[/dim]")
 
-    console.print(table)
-
+    parts = [table]
     if result.samples:
-        console.print(
+        bars, lo, hi = _histogram(result.samples, 40)
+        parts.append(
             Panel(
-                f"[{color}]{create_histogram(result.samples)}[/{color}]\n"
-                f"[dim]Min: {min(result.samples):.1f} Mbps  "
-                f"Max: {max(result.samples):.1f} Mbps[/dim]",
+                f"[{color}]{bars}[/{color}]\n"
+                f"[dim]Min: {lo:.1f} Mbps  Max: {hi:.1f} Mbps[/dim]",
                 title="Speed Over Time",
             )
         )
@@ -160,14 +244,32 @@ def print_speed_result(result, title: str, color: str = "green") -> None:  # noq
         ct.add_column("Server")
         ct.add_column("Bytes", justify="right")
         ct.add_column("Speed", justify="right")
-        for conn in result.connections:
-            ct.add_row(
+        rows = [
+            (
                 str(conn.id),
                 conn.hostname[:30],
                 f"{conn.bytes_transferred / 1_000_000:.1f} MB",
                 format_speed(conn.speed_mbps),
             )
-        console.print(ct)
+            for conn in result.connections
+        ]
+        add_row = ct.add_row
+        for row in rows:
+            add_row(*row)
+        parts.append(ct)
+
+    console.print(Group(*parts))
+
+
+_FINAL_HEAD = (
+    "[bold cyan]Server:[/bold cyan] %s (%s)\n\n"
+    "[bold white]   Ping:[/bold white]  [bold yellow]%.1f ms[/bold yellow]  "
+    "[dim](jitter: %.2f ms)[/dim]"
+)
+_FINAL_LOSS = "\n[bold white]   Packet Loss:[/bold white]  [bold red]%.1f%%[/bold red]"
+_FINAL_DOWNLOAD = "\n[bold white]   Download:[/bold white]  [bold green]%s[/bold green]"
+_FINAL_UPLOAD = "\n[bold white]   Upload:[/bold white]  [bold blue]%s[/bold blue]"
+_FINAL_LOADED = "\n[dim]      Loaded latency: %.1f ms[/dim]"
 
 
 def print_final_results(
@@ -181,33 +283,29 @@ def print_final_results(
     dl_loaded_latency: float = 0.0,
     ul_loaded_latency: float = 0.0,
 ) -> None:
-    lines = [
-        f"[bold cyan]Server:[/bold cyan] {server_name} ({server_sponsor})\n",
-        f"[bold white]   Ping:[/bold white]  [bold yellow]{ping_ms:.1f} ms[/bold yellow]  "
-        f"[dim](jitter: {jitter_ms:.2f} ms)[/dim]",
-    ]
+    from rich.console import Group
+    from rich.panel import Panel
+
+    body = _FINAL_HEAD % (server_name, server_sponsor, ping_ms, jitter_ms)
     if packet_loss > 0:
-        lines.append(f"[bold white]   Packet Loss:[/bold white]  [bold red]{packet_loss:.1f}%[/bold red]")
-    lines.append(f"[bold white]   Download:[/bold white]  [bold green]{format_speed(download_mbps)}[/bold green]")
+        body += _FINAL_LOSS % packet_loss
+    body += _FINAL_DOWNLOAD % format_speed(download_mbps)
     if dl_loaded_latency > 0:
-        lines.append(f"[dim]      Loaded latency: {dl_loaded_latency:.1f} ms[/dim]")
-    lines.append(f"[bold white]   Upload:[/bold white]  [bold blue]{format_speed(upload_mbps)}[/bold blue]")
+        body += _FINAL_LOADED % dl_loaded_latency
+    body += _FINAL_UPLOAD % format_speed(upload_mbps)
     if ul_loaded_latency > 0:
-        lines.append(f"[dim]      Loaded latency: {ul_loaded_latency:.1f} ms[/dim]")
+        body += _FINAL_LOADED % ul_loaded_latency
 
-    console.print()
-    console.print(
-        Panel.fit(
-            "\n".join(lines),
-            title="[bold]Results[/bold]",
-            border_style="cyan",
-        )
-    )
-    console.print()
+    panel = Panel.fit(body, title="[bold]Results[/bold]", border_style="cyan")
+    console.print(Group("", panel, ""))
 
 
 def print_history(entries: List[dict]) -> None:
     """Print a history table with sparkline trends."""
+    from rich import box
+    from rich.console import Group
+    from rich.table import Table
+
     from client.history import format_history_table, sparkline
 
     rows = format_history_table(entries)
@@ -222,35 +320,45 @@ def print_history(entries: List[dict]) -> None:
     table.add_column("Download", justify="right")
     table.add_column("Upload", justify="right")
 
+    # Collect the trend columns in the same pass that fills the table.
+    dl_values: List[float] = []
+    ul_values: List[float] = []
+    ping_values: List[float] = []
     for r in rows:
+        ping, dl, ul = r["ping"], r["download"], r["upload"]
         table.add_row(
             r["timestamp"],
             r["server"][:35],
-            f"{r['ping']:.1f} ms",
-            format_speed(r["download"]),
-            format_speed(r["upload"]),
+            f"{ping:.1f} ms",
+            format_speed(dl),
+            format_speed(ul),
         )
-
-    console.print(table)
+        if dl > 0:
+            dl_values.append(dl)
+        if ul > 0:
+            ul_values.append(ul)
+        if ping > 0:
+            ping_values.append(ping)
 
     # Sparkline trends
-    dl_values = [r["download"] for r in rows if r["download"] > 0]
-    ul_values = [r["upload"] for r in rows if r["upload"] > 0]
-    ping_values = [r["ping"] for r in rows if r["ping"] > 0]
-
+    parts = [table]
     if dl_values:
-        console.print(f"  [green]Download trend:[/green] {sparkline(dl_values)}  "
-                       f"[dim]{min(dl_values):.0f}-{max(dl_values):.0f} Mbps[/dim]")
+        parts.append(f"  [green]Download trend:[/green] {sparkline(dl_values)}  "
+                     f"[dim]{min(dl_values):.0f}-{max(dl_values):.0f} Mbps[/dim]")
     if ul_values:
-        console.print(f"  [blue]Upload trend:[/blue]   {sparkline(ul_values)}  "
-                       f"[dim]{min(ul_values):.0f}-{max(ul_values):.0f} Mbps[/dim]")
+        parts.append(f"  [blue]Upload trend:[/blue]   {sparkline(ul_values)}  "
+                     f"[dim]{min(ul_values):.0f}-{max(ul_values):.0f} Mbps[/dim]")
     if ping_values:
-        console.print(f"  [yellow]Ping trend:[/yellow]     {sparkline(ping_values)}  "
-                       f"[dim]{min(ping_values):.0f}-{max(ping_values):.0f} ms[/dim]")
+        parts.append(f"  [yellow]Ping trend:[/yellow]     {sparkline(ping_values)}  "
+                     f"[dim]{min(ping_values):.0f}-{max(ping_values):.0f} ms[/dim]")
+    console.print(Group(*parts))
 
 
 def print_hourly_analysis(rows: list) -> None:
     """Print time-of-day analysis table."""
+    from rich import box
+    from rich.table import Table
+
     if not rows:
         console.print("[dim]Not enough history data for hourly analysis.[/dim]")
         return
@@ -282,35 +390,50 @@ class ProgressDisplay:
     """Manages a ``rich`` progress bar during download / upload tests."""
 
     def __init__(self) -> None:
+        from rich.progress import (
+            BarColumn,
+            Progress,
+            SpinnerColumn,
+            TextColumn,
+            TimeElapsedColumn,
+        )
+
         self.progress = Progress(
             SpinnerColumn(),
-            TextColumn("[bold]{task.description}"),
+            # Styles are set on the columns, so the text rich re-renders on
+            # every refresh is plain and never goes through the markup parser.
+            TextColumn("{task.description}", style="bold", markup=False),
             BarColumn(bar_width=40),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TextColumn("[bold cyan]{task.fields[speed]}[/bold cyan]"),
+            TextColumn("{task.percentage:>3.0f}%", style="progress.percentage", markup=False),
+            TextColumn("{task.fields[speed]}", style="bold cyan", markup=False),
             TimeElapsedColumn(),
-            console=console,
+            console=get_console(),
         )
         self._task_id = None
-        self._last_speed = 0.0
-        self._last_prog = 0.0
+        self._last_prog_i = -1
+        self._last_speed = -1.0
+        self._speed_str = "..."
 
     def start(self, description: str) -> None:
         self.progress.start()
         self._task_id = self.progress.add_task(description, total=100, speed="")
-        self._last_speed = 0.0
-        self._last_prog = 0.0
+        self._last_prog_i = -1
+        self._last_speed = -1.0
+        self._speed_str = "..."
 
     def update(self, progress: float, speed_mbps: float = 0) -> None:
         if self._task_id is None:
             return
-        # Debounce: only update when values change noticeably
-        if abs(progress - self._last_prog) < 0.01 and abs(speed_mbps - self._last_speed) < 1.0:
+        # Debounce on whole percent and on the speed label actually shown
+        prog_i = int(progress * 100)
+        speed = round(speed_mbps, 2)  # the precision format_speed shows
+        if speed != self._last_speed:
+            self._last_speed = speed
+            self._speed_str = format_speed(speed_mbps) if speed_mbps > 0 else "..."
+        elif prog_i == self._last_prog_i:
             return
-        speed_str = format_speed(speed_mbps) if speed_mbps > 0 else "..."
-        self.progress.update(self._task_id, completed=progress * 100, speed=speed_str)
-        self._last_prog = progress
-        self._last_speed = speed_mbps
+        self._last_prog_i = prog_i
+        self.progress.update(self._task_id, completed=progress * 100, speed=self._speed_str)
 
     def stop(self) -> None:
         self.progress.stop()
@@ -5,10 +5,38 @@ from __future__ import annotations
 
 import json
 import os
-import statistics
-from datetime import datetime, timezone
+import time
 from typing import Any, Dict, List, Optional
 
+from client.stats import calculate_stats_bundle
+
+try:
+    import orjson
+except ImportError:  # optional speed-up (the "fast" extra)
+    orjson = None
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last timestamp formatted
+_ts_cache: List[Any] = [-1, ""]
+
+
+def _utc_timestamp() -> str:
+    """
+    Current UTC time in ISO 8601 with microseconds, e.g.
+    ``2025-01-01T12:00:00.123456+00:00``.  The date/time part is formatted
+    once per second; only the fraction is rebuilt on each call.
+    """
+    now = time.time()
+    sec = int(now)
+    usec = round((now - sec) * 1_000_000)  # rounds like datetime.fromtimestamp
+    if usec == 1_000_000:
+        sec += 1
+        usec = 0
+    if sec != _ts_cache[0]:
+        _ts_cache[0] = sec
+        _ts_cache[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+    return f"{_ts_cache[1]}.{usec:06d}+00:00"
+
 
 def create_result_json(
     client_info: Dict[str, Any],
@@ -20,18 +48,14 @@ def create_result_json(
 ) -> Dict[str, Any]:
     """Build a comprehensive JSON result dict matching Ookla's format."""
     pings: List[float] = latency_results.get("pings", [])
+    if not isinstance(pings, list):  # e.g. an array('d') straight from the tester
+        pings = list(pings)
     n = len(pings)
-
-    if pings:
-        s = sorted(pings)
-        rtt_min, rtt_max = s[0], s[-1]
-        rtt_mean = sum(pings) / n
-        rtt_median = statistics.median(pings)
-    else:
-        rtt_min = rtt_max = rtt_mean = rtt_median = 0
+    # One sort serves min, max, median and every percentile.
+    rtt = calculate_stats_bundle(pings, (50, 90, 99, 99.9))
 
     result: Dict[str, Any] = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _utc_timestamp(),
         "client": client_info,
         "server": server_info,
         "ping": latency_results.get("latency_ms", 0),
@@ -42,31 +66,21 @@ def create_result_json(
             "tcp": {
                 "jitter": latency_results.get("jitter_ms", 0),
                 "rtt": {
-                    "min": rtt_min,
-                    "max": rtt_max,
-                    "mean": rtt_mean,
-                    "median": rtt_median,
+                    "min": rtt["min"],
+                    "max": rtt["max"],
+                    "mean": rtt["mean"],
+                    "median": rtt["median"],
+                    "p50": rtt["p50"],
+                    "p90": rtt["p90"],
+                    "p99": rtt["p99"],
+                    "p999": rtt["p999"],
                 },
                 "count": n,
                 "samples": pings,
             },
         },
-        "download": {
-            "speed_bps": download_results.get("speed_bps", 0),
-            "speed_mbps": download_results.get("speed_mbps", 0),
-            "bytes": download_results.get("bytes_total", 0),
-            "duration_ms": download_results.get("duration_ms", 0),
-            "connections": download_results.get("connections", []),
-            "samples": download_results.get("samples", []),
-        },
-        "upload": {
-            "speed_bps": upload_results.get("speed_bps", 0),
-            "speed_mbps": upload_results.get("speed_mbps", 0),
-            "bytes": upload_results.get("bytes_total", 0),
-            "duration_ms": upload_results.get("duration_ms", 0),
-            "connections": upload_results.get("connections", []),
-            "samples": upload_results.get("samples", []),
-        },
+        "download": _transfer_section(download_results),
+        "upload": _transfer_section(upload_results),
     }
 
     if server_selection:
@@ -75,14 +89,71 @@ def create_result_json(
     return result
 
 
-def save_json(result: Dict[str, Any], filepath: str) -> None:
-    """Write *result* to *filepath* atomically (write-tmp then rename)."""
+def _transfer_section(results: Dict[str, Any]) -> Dict[str, Any]:
+    """The ``download`` / ``upload`` block of the result JSON."""
+    return {
+        "speed_bps": results.get("speed_bps", 0),
+        "speed_mbps": results.get("speed_mbps", 0),
+        "bytes": results.get("bytes_total", 0),
+        "duration_ms": results.get("duration_ms", 0),
+        "connections": results.get("connections", []),
+        "samples": results.get("samples", []),
+    }
+
+
+def dumps_json(result: Dict[str, Any], indent: bool = True) -> bytes:
+    """Serialise *result* to UTF-8 JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        text = json.dumps(result, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+# Synchronous writes where the platform has them; otherwise fsync explicitly.
+_O_DSYNC = getattr(os, "O_DSYNC", 0)
+
+
+def _write_file(path: str, payload: memoryview, durable: bool) -> None:
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    if durable:
+        flags |= _O_DSYNC
+    fd = os.open(path, flags, 0o666)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload):]
+        if durable and not _O_DSYNC:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def save_json(result: Dict[str, Any], filepath: str, atomic: bool = True) -> None:
+    """
+    Write *result* to *filepath*.
+
+    With *atomic* (the default) the data goes to a temp file that is synced
+    and then renamed over *filepath*, so readers never see a partial file.
+    ``atomic=False`` writes *filepath* in place: fewer syscalls and no sync,
+    for output nobody reads concurrently.
+    """
+    # Encode once and hand the bytes straight to the fd: no TextIOWrapper.
+    payload = memoryview(dumps_json(result))
+
+    if not atomic:
+        try:
+            _write_file(filepath, payload, durable=False)
+        except OSError as exc:
+            raise IOError(f"Failed to save JSON to {filepath}: {exc}") from exc
+        return
+
     dir_path = os.path.dirname(filepath) or "."
     tmp = os.path.join(dir_path, f".tmp_{os.path.basename(filepath)}")
 
     try:
-        with open(tmp, "w", encoding="utf-8") as fh:
-            json.dump(result, fh, indent=2, ensure_ascii=False)
+        _write_file(tmp, payload, durable=True)
         os.replace(tmp, filepath)
     except (IOError, OSError) as exc:
         # Clean up partial temp file
@@ -123,8 +194,11 @@ def format_text_result(
     )
 
 
+CSV_HEADER = "timestamp,server,isp,ip,ping_ms,jitter_ms,download_mbps,upload_mbps"
+
+
 def format_csv_header() -> str:
-    return "timestamp,server,isp,ip,ping_ms,jitter_ms,download_mbps,upload_mbps"
+    return CSV_HEADER
 
 
 def _csv_escape(value: str) -> str:
@@ -143,7 +217,7 @@ def format_csv_row(
     download_mbps: float,
     upload_mbps: float,
 ) -> str:
-    ts = datetime.now(timezone.utc).isoformat()
+    ts = _utc_timestamp()
     srv = _csv_escape(server_name)
     isp_safe = _csv_escape(isp)
     ip_safe = _csv_escape(ip)